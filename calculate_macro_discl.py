@@ -23,17 +23,44 @@ Usage in Google Colab:
 import os
 import re
 import csv
-from pathlib import Path
-from typing import Dict, List, Tuple
-
-# BeautifulSoup for HTML parsing
+import hashlib
+import html
+import logging
+import logging.handlers
+import mmap
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+# lxml for HTML parsing
 try:
-    from bs4 import BeautifulSoup
+    from lxml import html as lxml_html
+    from lxml.etree import ParserError
 except ImportError:
-    print("Installing beautifulsoup4...")
+    print("Installing lxml...")
     import subprocess
-    subprocess.check_call(['pip', 'install', 'beautifulsoup4'])
-    from bs4 import BeautifulSoup
+    subprocess.check_call(['pip', 'install', 'lxml'])
+    from lxml import html as lxml_html
+    from lxml.etree import ParserError
+
+# pyahocorasick for single-pass dictionary matching (optional; falls back to regex)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Google RE2 for linear-time matching in the regex fallback (optional)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Numba-compiled byte scanner for dictionary matching (optional; fastest path)
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Mount Google Drive (for Colab)
 try:
@@ -55,6 +82,52 @@ INPUT_FOLDER = "/content/drive/MyDrive/My_10K_Files/"
 # Output CSV file path
 OUTPUT_CSV = "/content/drive/MyDrive/MacroDiscl_Results.csv"
 
+# Strip HTML with regexes (fast). Set to True to build a full lxml parse tree
+# instead, which is slower but more forgiving of badly malformed HTML
+USE_HTML_PARSER = False
+
+# Number of worker processes (None = one per CPU core)
+MAX_WORKERS = None
+
+# Flush the results CSV to disk every N rows while processing
+CSV_FLUSH_EVERY = 50
+
+# Per-file progress lines are buffered and written to the console in batches
+# of this size (writing to the Colab front-end line by line is slow)
+LOG_BUFFER_LINES = 20
+
+# Folder caching each filing's cleaned, normalized text so re-runs skip HTML
+# cleaning. Entries are keyed by file path, modification time and size, so
+# edited filings are re-processed; dictionary edits do not invalidate them.
+# Set to None to disable caching.
+CACHE_DIR = "/content/drive/MyDrive/MacroDiscl_Cache/"
+
+# Part of every cache key. Bump it whenever the cleaning changes (_strip_blocks,
+# _strip_tags, _clean_html_with_parser, clean_text_for_matching), so entries
+# cleaned by the old code are not served anymore
+CACHE_VERSION = 1
+
+# =============================================================================
+# LOGGING
+# =============================================================================
+
+logger = logging.getLogger('macrodiscl')
+if not logger.handlers:
+    _console = logging.StreamHandler(sys.stdout)
+    _console.setFormatter(logging.Formatter('%(message)s'))
+    # Warnings and errors are written out immediately
+    logger.addHandler(logging.handlers.MemoryHandler(
+        LOG_BUFFER_LINES, flushLevel=logging.WARNING, target=_console
+    ))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _flush_log() -> None:
+    """Write out buffered log lines (call before printing to stdout directly)."""
+    for handler in logger.handlers:
+        handler.flush()
+
 # =============================================================================
 # MACRO DICTIONARY (Holstead et al., 2024)
 # =============================================================================
@@ -94,6 +167,189 @@ BIGRAMS = [
     'discount rate', 'business cycle', 'global trade'
 ]
 
+
+def _build_automaton():
+    """
+    Build a single Aho-Corasick automaton over the whole dictionary.
+
+    Each term is stored with its breakdown category and whether it must sit
+    on word boundaries, so one scan of the text counts every category.
+
+    Returns:
+        A finalized ahocorasick.Automaton, or None if pyahocorasick is missing
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in EXACT_UNIGRAMS:
+        automaton.add_word(term, ('exact_unigrams', len(term), True))
+    for term in SUBSTRING_UNIGRAMS:
+        automaton.add_word(term, ('substring_unigrams', len(term), False))
+    for bigram in BIGRAMS:
+        automaton.add_word(bigram, ('bigrams', len(bigram), False))
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
+# Breakdown categories, indexed by the Numba scanner's counters
+_CATEGORIES = ('exact_unigrams', 'substring_unigrams', 'bigrams')
+
+
+def _build_byte_tables():
+    """
+    Build an Aho-Corasick DFA over UTF-8 bytes as NumPy arrays for the Numba
+    scanner. All dictionary terms are ASCII, so byte matches are exactly the
+    character matches on the decoded text.
+
+    Returns:
+        Tuple of (delta, out_ptr, out_category, out_length, out_boundary):
+        delta[state, byte] is the next state, and the outputs of a state
+        (its own term plus those reachable through fail links) are the
+        entries out_ptr[state]:out_ptr[state + 1] of the out_* arrays
+    """
+    terms = (
+        [(term, 0, True) for term in EXACT_UNIGRAMS]
+        + [(term, 1, False) for term in SUBSTRING_UNIGRAMS]
+        + [(bigram, 2, False) for bigram in BIGRAMS]
+    )
+
+    # Trie of all terms
+    children = [{}]
+    outputs = [[]]
+    for term, category, word_boundary in terms:
+        state = 0
+        for byte in term.encode('utf-8'):
+            if byte not in children[state]:
+                children.append({})
+                outputs.append([])
+                children[state][byte] = len(children) - 1
+            state = children[state][byte]
+        outputs[state].append((category, len(term), word_boundary))
+
+    # Breadth-first pass: fail links, full transition table, merged outputs
+    delta = np.zeros((len(children), 256), dtype=np.int32)
+    fail = [0] * len(children)
+    queue = list(children[0].values())
+    for byte, child in children[0].items():
+        delta[0, byte] = child
+    for state in queue:
+        outputs[state] = outputs[state] + outputs[fail[state]]
+        for byte in range(256):
+            child = children[state].get(byte)
+            if child is None:
+                delta[state, byte] = delta[fail[state], byte]
+            else:
+                delta[state, byte] = child
+                fail[child] = delta[fail[state], byte]
+                queue.append(child)
+
+    # Flatten outputs into CSR-style arrays
+    out_ptr = np.zeros(len(children) + 1, dtype=np.int32)
+    flat = []
+    for state, state_outputs in enumerate(outputs):
+        flat.extend(state_outputs)
+        out_ptr[state + 1] = len(flat)
+    out_category = np.array([o[0] for o in flat], dtype=np.int8)
+    out_length = np.array([o[1] for o in flat], dtype=np.int32)
+    out_boundary = np.array([o[2] for o in flat], dtype=np.bool_)
+    return delta, out_ptr, out_category, out_length, out_boundary
+
+
+if njit is not None:
+    @njit
+    def _scan_bytes(buf, delta, out_ptr, out_category, out_length, out_boundary):
+        """
+        Walk the DFA over a uint8 buffer and count matches per category.
+        Word-boundary terms must be bounded by a space (byte 32) or an edge.
+        """
+        counts = np.zeros(3, dtype=np.int64)
+        state = 0
+        n = buf.size
+        for i in range(n):
+            state = delta[state, buf[i]]
+            for k in range(out_ptr[state], out_ptr[state + 1]):
+                if out_boundary[k]:
+                    start = i - out_length[k] + 1
+                    if start > 0 and buf[start - 1] != 32:
+                        continue
+                    if i + 1 < n and buf[i + 1] != 32:
+                        continue
+                counts[out_category[k]] += 1
+        return counts
+
+    _BYTE_TABLES = _build_byte_tables()
+    # Compile now (for the read-only buffers np.frombuffer returns) so worker
+    # processes forked later inherit the compiled scanner
+    _scan_bytes(np.frombuffer(b'', dtype=np.uint8), *_BYTE_TABLES)
+else:
+    _BYTE_TABLES = None
+
+
+def _union_pattern(terms: List[str]) -> str:
+    """
+    Join terms into one alternation, longest first so the longest term wins.
+
+    Args:
+        terms: Dictionary terms (already lowercase)
+
+    Returns:
+        Non-capturing alternation pattern string
+    """
+    ordered = sorted(terms, key=len, reverse=True)
+    return '(?:' + '|'.join(re.escape(term) for term in ordered) + ')'
+
+
+# RE2 bigram pattern for the fallback. It matches over UTF-8 bytes: the re2
+# bindings re-encode str input on every call, which would make the restarting
+# bigram search quadratic.
+if re2 is not None:
+    _BIGRAM_RE2 = re2.compile(_union_pattern(BIGRAMS).encode('utf-8'))
+
+# Lookups for the fallback. Exact unigrams are whole tokens. Bigrams are
+# matched as substrings (e.g. "macroeconomic conditions" contains "economic
+# condition") through a two-level trie: each shared first word followed by
+# a space is located once, then its second words are checked in place.
+def _group_bigrams() -> Dict[str, Tuple[str, ...]]:
+    """
+    Group the bigram dictionary by first word.
+
+    Returns:
+        Mapping of "first word " (with trailing space) -> tuple of second words
+    """
+    tails = {}
+    for bigram in BIGRAMS:
+        head, tail = bigram.split(' ')
+        tails[head + ' '] = tails.get(head + ' ', ()) + (tail,)
+    return tails
+
+
+_EXACT_SET = frozenset(EXACT_UNIGRAMS)
+_BIGRAM_TRIE = _group_bigrams()
+
+# Filings are fed to lxml as UTF-8 bytes: lxml rejects str input that starts
+# with an XML encoding declaration, which inline XBRL 10-Ks do
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True)
+
+# Elements dropped before extracting text (tables approximate financial statements)
+_DROP_XPATH = '//script|//style|//head|//title|//meta|//table'
+
+# Regex equivalents for the parser-free path. The table pattern only matches a
+# table with no other table inside it, so nested tables are peeled innermost first.
+# Bytes variants let whole blocks be dropped from the file before decoding.
+_BLOCK_PATTERN = r'<!--.*?-->|<(script|style|head|title)\b[^>]*>.*?</\1\s*>'
+_TABLE_PATTERN = r'<table\b[^>]*>[^<]*(?:<(?!/?table\b)[^<]*)*</table\s*>'
+_BLOCK_RE = re.compile(_BLOCK_PATTERN, re.IGNORECASE | re.DOTALL)
+_TABLE_RE = re.compile(_TABLE_PATTERN, re.IGNORECASE)
+_BLOCK_RE_BYTES = re.compile(_BLOCK_PATTERN.encode('ascii'), re.IGNORECASE | re.DOTALL)
+_TABLE_RE_BYTES = re.compile(_TABLE_PATTERN.encode('ascii'), re.IGNORECASE)
+_TAG_RE = re.compile(r'<[a-zA-Z/!?][^>]*>')
+
+# Any run of punctuation and/or whitespace becomes a single space
+_NON_WORD_RE = re.compile(r'\W+')
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -110,27 +366,107 @@ def clean_html_and_tables(text: str) -> str:
     Returns:
         Cleaned text with HTML removed and tables excluded
     """
-    # Parse HTML
-    soup = BeautifulSoup(text, 'html.parser')
+    if USE_HTML_PARSER:
+        return _clean_html_with_parser(text)
 
-    # Remove script and style elements
-    for element in soup(['script', 'style', 'head', 'title', 'meta']):
-        element.decompose()
+    return _strip_tags(_strip_blocks(text))
 
-    # Remove table elements (attempt to exclude financial tables)
-    for table in soup.find_all('table'):
-        table.decompose()
 
-    # Extract visible text
-    text = soup.get_text(separator=' ')
+def _strip_blocks(text):
+    """
+    Remove comments, script/style/head blocks and tables without building a DOM.
 
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+    Args:
+        text: Raw text or raw file bytes (str, bytes or mmap)
 
+    Returns:
+        The input with those blocks replaced by spaces (str for str input,
+        bytes otherwise)
+    """
+    if isinstance(text, str):
+        block_re, table_re, space, tag_open = _BLOCK_RE, _TABLE_RE, ' ', '<'
+    else:
+        block_re, table_re, space, tag_open = _BLOCK_RE_BYTES, _TABLE_RE_BYTES, b' ', b'<'
+
+    # Plain-text filings have no markup at all
+    if text.find(tag_open) == -1:
+        return text if isinstance(text, str) else bytes(text)
+
+    text = block_re.sub(space, text)
+    removed = 1
+    while removed:
+        text, removed = table_re.subn(space, text)
     return text
 
 
+def _strip_tags(text: str) -> str:
+    """
+    Strip the remaining tags, decode entities and normalize whitespace.
+
+    Args:
+        text: Text whose tables and script/style blocks are already removed
+
+    Returns:
+        Plain text
+    """
+    if '<' in text:
+        text = _TAG_RE.sub(' ', text)
+
+    # Decode entities once, on the stripped text, then collapse whitespace
+    # (split/join does both the collapsing and the strip in C)
+    return ' '.join(html.unescape(text).split())
+
+
+def _read_without_blocks(file_path: str) -> str:
+    """
+    Read a filing through mmap and drop tables and script/style blocks
+    before decoding, so only the (much smaller) remainder becomes a str.
+
+    Args:
+        file_path: Path to the 10-K text file
+
+    Returns:
+        Decoded text with blocks removed
+    """
+    with open(file_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            data = _strip_blocks(buf)
+    return data.decode('utf-8', errors='ignore')
+
+
+def _clean_html_with_parser(text: str) -> str:
+    """
+    Parser-based variant of clean_html_and_tables (see USE_HTML_PARSER).
+
+    Args:
+        text: Raw text (may contain HTML)
+
+    Returns:
+        Cleaned text with HTML removed and tables excluded
+    """
+    # Plain-text filings have nothing to parse
+    if '<' not in text:
+        return ' '.join(html.unescape(text).split())
+
+    # Parse HTML (lxml refuses to build a document from empty input)
+    try:
+        tree = lxml_html.document_fromstring(text.encode('utf-8'), parser=_HTML_PARSER)
+    except ParserError:
+        return ''
+
+    # Remove script/style/head elements and tables (attempt to exclude
+    # financial tables); drop_tree keeps the text that follows each element
+    for element in tree.xpath(_DROP_XPATH):
+        element.drop_tree()
+
+    # Extract visible text with whitespace collapsed, joining the words of
+    # each text node directly rather than building the raw joined text first
+    return ' '.join(word for node in tree.itertext() for word in node.split())
+
+
 def clean_text_for_matching(text: str) -> str:
     """
     Prepare text for matching by:
@@ -147,15 +483,10 @@ def clean_text_for_matching(text: str) -> str:
     # Convert to lowercase (paper explicitly requires this)
     text = text.lower()
 
-    # Replace punctuation with spaces to enable clean bigram matching
+    # Replace punctuation with spaces to enable clean bigram matching and
+    # normalize whitespace in one pass (each non-word run -> single space)
     # This handles cases like "economic, condition" -> "economic condition"
-    text = re.sub(r'[^\w\s]', ' ', text)
-
-    # Normalize whitespace (multiple spaces -> single space)
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-
-    return text
+    return _NON_WORD_RE.sub(' ', text).strip()
 
 
 def count_words(text: str) -> int:
@@ -163,13 +494,15 @@ def count_words(text: str) -> int:
     Count total words in the text.
 
     Args:
-        text: Cleaned and normalized text
+        text: Cleaned and normalized text (single spaces, no leading or
+            trailing whitespace, as returned by clean_text_for_matching)
 
     Returns:
         Total word count
     """
-    words = text.split()
-    return len(words)
+    # Words are separated by exactly one space, so there is no need to
+    # materialize the token list
+    return text.count(' ') + 1 if text else 0
 
 
 def count_macro_terms(text: str) -> Tuple[int, Dict[str, int]]:
@@ -190,29 +523,154 @@ def count_macro_terms(text: str) -> Tuple[int, Dict[str, int]]:
         'bigrams': 0
     }
 
-    # Count exact match unigrams (with word boundaries)
-    for term in EXACT_UNIGRAMS:
-        pattern = r'\b' + re.escape(term) + r'\b'
-        matches = re.findall(pattern, text)
-        breakdown['exact_unigrams'] += len(matches)
-
-    # Count substring match unigrams (no word boundaries)
-    for term in SUBSTRING_UNIGRAMS:
-        # Simple substring count (case already handled - text is lowercase)
-        matches = re.findall(term, text)
-        breakdown['substring_unigrams'] += len(matches)
-
-    # Count bigrams (consecutive two-word phrases)
-    for bigram in BIGRAMS:
-        # Bigrams are already lowercase, text is lowercase
-        # Since we've cleaned punctuation, we can do simple string matching
-        matches = re.findall(re.escape(bigram), text)
-        breakdown['bigrams'] += len(matches)
+    if _BYTE_TABLES is not None:
+        # Compiled single pass over the UTF-8 bytes
+        buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        counts = _scan_bytes(buf, *_BYTE_TABLES)
+        for category, count in zip(_CATEGORIES, counts):
+            breakdown[category] = int(count)
+
+        total_macro_count = sum(breakdown.values())
+        return total_macro_count, breakdown
+
+    if _AUTOMATON is not None:
+        # One linear scan finds every dictionary term (overlaps included,
+        # matching the per-term counting below)
+        text_len = len(text)
+        for end_idx, (category, term_len, word_boundary) in _AUTOMATON.iter(text):
+            if word_boundary:
+                # Text is punctuation-stripped, so a boundary is a space or an edge
+                start_idx = end_idx - term_len + 1
+                if start_idx > 0 and text[start_idx - 1] != ' ':
+                    continue
+                if end_idx + 1 < text_len and text[end_idx + 1] != ' ':
+                    continue
+            breakdown[category] += 1
+
+        total_macro_count = sum(breakdown.values())
+        return total_macro_count, breakdown
+
+    # Tokenize once; punctuation is already replaced by spaces
+    tokens = text.split()
+
+    # Count exact match unigrams (whole tokens)
+    breakdown['exact_unigrams'] = sum(map(_EXACT_SET.__contains__, tokens))
+
+    # Count substring match unigrams (plain literals, no word boundaries)
+    breakdown['substring_unigrams'] = sum(text.count(term) for term in SUBSTRING_UNIGRAMS)
+
+    if re2 is not None:
+        data = text.encode('utf-8')
+
+        # Count bigrams (consecutive two-word phrases). Bigrams can overlap
+        # (e.g. "foreign exchange market"), so restart one byte after each hit
+        match = _BIGRAM_RE2.search(data)
+        while match:
+            breakdown['bigrams'] += 1
+            match = _BIGRAM_RE2.search(data, match.start() + 1)
+    else:
+        # Count bigrams by locating each first word, then its second words
+        for head, tails in _BIGRAM_TRIE.items():
+            pos = text.find(head)
+            while pos != -1:
+                pos += len(head)
+                for tail in tails:
+                    if text.startswith(tail, pos):
+                        breakdown['bigrams'] += 1
+                pos = text.find(head, pos)
 
     total_macro_count = sum(breakdown.values())
     return total_macro_count, breakdown
 
 
+def _prepare_text(file_path: str) -> str:
+    """
+    Read a filing and run the full cleaning pipeline on it.
+
+    Args:
+        file_path: Path to the 10-K text file
+
+    Returns:
+        Text ready for pattern matching
+    """
+    # Step 1: Read file, clean HTML and remove tables
+    if USE_HTML_PARSER:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            raw_text = f.read()
+        cleaned_text = clean_html_and_tables(raw_text)
+    else:
+        cleaned_text = _strip_tags(_read_without_blocks(file_path))
+
+    # Step 2: Prepare for matching (lowercase, remove punctuation)
+    return clean_text_for_matching(cleaned_text)
+
+
+def _cache_file_for(file_path: str) -> str:
+    """
+    Build the cache file path for a filing from its path, mtime and size,
+    the cleaning path and CACHE_VERSION.
+
+    Args:
+        file_path: Path to the 10-K text file
+
+    Returns:
+        Path of the cache entry inside CACHE_DIR
+    """
+    stat = os.stat(file_path)
+    key = (
+        f"{CACHE_VERSION}|{os.path.abspath(file_path)}|{stat.st_mtime_ns}|"
+        f"{stat.st_size}|{USE_HTML_PARSER}"
+    )
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, digest + '.txt')
+
+
+def _read_cache(cache_file: str) -> Optional[str]:
+    """
+    Read a cached processed text.
+
+    Args:
+        cache_file: Path of the cache entry
+
+    Returns:
+        The cached text, or None on a cache miss
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+# Set once this process has warned about a failed cache write
+_cache_write_warned = False
+
+
+def _write_cache(cache_file: str, text: str) -> None:
+    """
+    Store a processed text in the cache. Failures are ignored since the
+    cache is only an optimization; the first one in each process is logged.
+
+    Args:
+        cache_file: Path of the cache entry
+        text: Processed text to store
+    """
+    global _cache_write_warned
+
+    # Write to a temporary file first so a concurrent or interrupted run
+    # never sees a partial entry
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        if not _cache_write_warned:
+            _cache_write_warned = True
+            logger.warning("⚠ Could not write cache entry %s: %s", cache_file, e)
+
+
 def calculate_macro_discl(file_path: str) -> Dict:
     """
     Calculate MacroDiscl measure for a single 10-K file.
@@ -235,15 +693,14 @@ def calculate_macro_discl(file_path: str) -> Dict:
     filename = os.path.basename(file_path)
 
     try:
-        # Read file
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            raw_text = f.read()
-
-        # Step 1: Clean HTML and remove tables
-        cleaned_text = clean_html_and_tables(raw_text)
-
-        # Step 2: Prepare for matching (lowercase, remove punctuation)
-        processed_text = clean_text_for_matching(cleaned_text)
+        # Steps 1-2: Clean HTML, remove tables and prepare for matching
+        # (served from CACHE_DIR when the file is unchanged)
+        cache_file = _cache_file_for(file_path) if CACHE_DIR else None
+        processed_text = _read_cache(cache_file) if cache_file else None
+        if processed_text is None:
+            processed_text = _prepare_text(file_path)
+            if cache_file:
+                _write_cache(cache_file, processed_text)
 
         # Step 3: Count total words
         total_words = count_words(processed_text)
@@ -273,7 +730,7 @@ def calculate_macro_discl(file_path: str) -> Dict:
         }
 
     except Exception as e:
-        print(f"✗ Error processing {filename}: {e}")
+        logger.error("✗ Error processing %s: %s", filename, e)
         return {
             'filename': filename,
             'total_words': 0,
@@ -291,8 +748,7 @@ def main():
     """
     Main execution function:
     1. Validate paths
-    2. Process all 10-K files
-    3. Save results to CSV
+    2. Process all 10-K files, saving each result to CSV as it completes
     """
     print("=" * 70)
     print("MacroDiscl Calculator (Holstead et al., 2024)")
@@ -307,13 +763,16 @@ def main():
     print(f"\n📁 Input folder: {INPUT_FOLDER}")
     print(f"📄 Output CSV: {OUTPUT_CSV}")
 
-    # Find all 10-K files
-    file_extensions = ['*.txt', '*.html', '*.htm']
-    files = []
-    for ext in file_extensions:
-        files.extend(Path(INPUT_FOLDER).glob(ext))
-
-    files = [str(f) for f in files]
+    # Find all 10-K files in a single directory pass (skipping hidden files,
+    # as glob did)
+    file_extensions = ('.txt', '.html', '.htm')
+    with os.scandir(INPUT_FOLDER) as entries:
+        files = [
+            entry.path for entry in entries
+            if not entry.name.startswith('.')
+            and entry.name.lower().endswith(file_extensions)
+            and entry.is_file()
+        ]
 
     if not files:
         print(f"\n✗ No files found with extensions: {file_extensions}")
@@ -324,66 +783,69 @@ def main():
     print("Processing files...")
     print("=" * 70)
 
-    # Process each file
-    results = []
-    for idx, file_path in enumerate(files, 1):
-        filename = os.path.basename(file_path)
-        print(f"\n[{idx}/{len(files)}] Processing: {filename}")
-
-        result = calculate_macro_discl(file_path)
-        results.append(result)
-
-        if result['status'] == 'success':
-            print(f"  ✓ Total words: {result['total_words']:,}")
-            print(f"  ✓ Macro terms: {result['macro_count']:,}")
-            print(f"  ✓ MacroDiscl: {result['macro_discl']:.4f}")
-            if 'breakdown' in result:
-                bd = result['breakdown']
-                print(f"    - Exact unigrams: {bd['exact_unigrams']}")
-                print(f"    - Substring unigrams: {bd['substring_unigrams']}")
-                print(f"    - Bigrams: {bd['bigrams']}")
-        else:
-            print(f"  ✗ Status: {result['status']}")
-
-    # Save results to CSV
-    print("\n" + "=" * 70)
-    print("Saving results...")
-    print("=" * 70)
+    # Process files across worker processes; map() yields results in input order
+    workers = MAX_WORKERS or os.cpu_count() or 1
+    chunksize = max(1, len(files) // (workers * 4))
+    print(f"Using {workers} worker process(es)")
 
+    # Rows are written as results arrive, so memory stays flat and a crash
+    # keeps everything finished so far
+    processed = 0
+    successful_discl = []
     try:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(OUTPUT_CSV), exist_ok=True)
 
-        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['Filename', 'TotalWords', 'MacroCount', 'MacroDiscl']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for result in results:
-                writer.writerow({
-                    'Filename': result['filename'],
-                    'TotalWords': result['total_words'],
-                    'MacroCount': result['macro_count'],
-                    'MacroDiscl': result['macro_discl']
-                })
-
-        print(f"\n✓ Results saved to: {OUTPUT_CSV}")
-        print(f"✓ Processed {len(results)} file(s)")
-
-        # Summary statistics
-        successful = [r for r in results if r['status'] == 'success']
-        if successful:
-            avg_discl = sum(r['macro_discl'] for r in successful) / len(successful)
-            print(f"\n📊 Summary Statistics:")
-            print(f"  - Files processed successfully: {len(successful)}")
-            print(f"  - Average MacroDiscl: {avg_discl:.4f}")
-            print(f"  - Min MacroDiscl: {min(r['macro_discl'] for r in successful):.4f}")
-            print(f"  - Max MacroDiscl: {max(r['macro_discl'] for r in successful):.4f}")
+        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Filename', 'TotalWords', 'MacroCount', 'MacroDiscl'])
+
+            file_results = executor.map(calculate_macro_discl, files, chunksize=chunksize)
+            for idx, (file_path, result) in enumerate(zip(files, file_results), 1):
+                filename = os.path.basename(file_path)
+                if result['status'] == 'success':
+                    bd = result['breakdown']
+                    logger.info(
+                        "[%d/%d] ✓ %s: words=%s macro=%s (exact=%d, substring=%d, "
+                        "bigrams=%d) MacroDiscl=%.4f",
+                        idx, len(files), filename,
+                        f"{result['total_words']:,}", f"{result['macro_count']:,}",
+                        bd['exact_unigrams'], bd['substring_unigrams'], bd['bigrams'],
+                        result['macro_discl']
+                    )
+                    successful_discl.append(result['macro_discl'])
+                else:
+                    logger.info("[%d/%d] ✗ %s: %s", idx, len(files), filename, result['status'])
+
+                writer.writerow((
+                    result['filename'], result['total_words'],
+                    result['macro_count'], result['macro_discl']
+                ))
+                processed += 1
+                if processed % CSV_FLUSH_EVERY == 0:
+                    csvfile.flush()
 
     except Exception as e:
+        _flush_log()
         print(f"\n✗ Error saving CSV: {e}")
         return
 
+    _flush_log()
+    print("\n" + "=" * 70)
+    print(f"✓ Results saved to: {OUTPUT_CSV}")
+    print(f"✓ Processed {processed} file(s)")
+    print("=" * 70)
+
+    # Summary statistics
+    if successful_discl:
+        avg_discl = sum(successful_discl) / len(successful_discl)
+        print(f"\n📊 Summary Statistics:")
+        print(f"  - Files processed successfully: {len(successful_discl)}")
+        print(f"  - Average MacroDiscl: {avg_discl:.4f}")
+        print(f"  - Min MacroDiscl: {min(successful_discl):.4f}")
+        print(f"  - Max MacroDiscl: {max(successful_discl):.4f}")
+
     print("\n" + "=" * 70)
     print("✓ Processing complete!")
     print("=" * 70)
@@ -19,10 +19,14 @@ Requirements:
 """
 
 import argparse
+import hashlib
 import json
+import logging
 import os
+import shutil
 import sys
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
@@ -32,6 +36,67 @@ from tqdm import tqdm
 # Import the original download_filings module
 import download_filings
 
+# Progress messages go through logging (to the console and the download_filings log file),
+# so they can be silenced with --log-level
+logger = logging.getLogger("edgar.batch")
+
+# orjson serializes straight to UTF-8 bytes, much faster than json (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Abort resume if more than this fraction of progress log lines are unreadable
+MAX_CORRUPT_PROGRESS_RATIO = 0.1
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write(path, data):
+    """
+    Replace a file's contents so a crash leaves either the old or the new version
+
+    Args:
+        path: File to write
+        data: Bytes to write
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _append_durably(path, data):
+    """
+    Append bytes to a file and fsync before returning
+
+    Args:
+        path: File to append to
+        data: Bytes to append
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 class ColabBatchDownloader:
     """
@@ -52,6 +117,8 @@ class ColabBatchDownloader:
         end_year=None,
         filing_types=None,
         user_agent=None,
+        write_config=False,
+        max_workers=1,
     ):
         """
         Initialize the batch downloader
@@ -63,6 +130,8 @@ class ColabBatchDownloader:
             end_year: Ending year for filings (defaults to current year)
             filing_types: List of filing types to download (default: ['10-K'])
             user_agent: User agent string for SEC requests
+            write_config: Also write each batch's settings to config.json (for debugging)
+            max_workers: Number of filings to download concurrently
         """
         self.input_file = input_file
         self.batch_size = batch_size
@@ -70,56 +139,103 @@ class ColabBatchDownloader:
         self.end_year = end_year or datetime.now().year
         self.filing_types = filing_types or ["10-K"]
         self.user_agent = user_agent or "YourName YourEmail@example.com"
+        self.write_config = write_config
+        self.max_workers = max_workers
 
         # Paths
-        self.progress_file = "logs/download_progress.csv"
+        self.progress_file = "logs/download_progress.jsonl"
+        # Progress file written by earlier versions, imported once if the log is missing
+        self.legacy_progress_file = "logs/download_progress.csv"
         self.config_file = "config.json"
 
         # Load firm data
         self.firms_df = None
+        self._ciks = None
         self.batches = []
         self.current_batch_id = 0
 
+        # download_filings settings and HTTP session, built once and reused for every batch
+        self._params = None
+        self._session = None
+
+        # config.json as loaded once, and a hash of the CIK list last written to it
+        self._config = None
+        self._last_config_hash = None
+
+        # (CIK, accession) pairs already downloaded in any earlier session
+        self._completed_filings = set()
+
+        # Accession numbers of filings already saved under the raw filings folder
+        self._existing_accessions = set()
+
+        # Latest progress record per batch_id, kept in sync with the progress log
+        self._progress = {}
+
     def load_firms(self):
         """Load firm identifiers from WRDS CSV file"""
-        print(f"\n📂 Loading firms from {self.input_file}...")
+        logger.info(f"\n📂 Loading firms from {self.input_file}...")
 
         try:
-            self.firms_df = pd.read_csv(self.input_file)
+            # Only parse the columns we use, as strings, to skip dtype inference
+            wanted = ["cik", "ticker", "company_name"]
+            self.firms_df = pd.read_csv(
+                self.input_file,
+                usecols=lambda col: col in wanted,
+                dtype={col: "string" for col in wanted},
+            )
 
             # Validate required columns
             if "cik" not in self.firms_df.columns:
-                print("❌ Error: 'cik' column not found in input file")
-                print(f"   Available columns: {list(self.firms_df.columns)}")
+                logger.error("❌ Error: 'cik' column not found in input file")
+                available = list(pd.read_csv(self.input_file, nrows=0).columns)
+                logger.error(f"   Available columns: {available}")
                 return False
 
-            # Convert CIK to string and remove any NaN values
-            self.firms_df["cik"] = self.firms_df["cik"].astype(str)
-            self.firms_df = self.firms_df[self.firms_df["cik"].notna()]
+            # Normalize CIKs to integers so "320193", "0000320193" and "320193.0"
+            # are the same firm; missing or non-numeric CIKs become NA and are dropped
+            self.firms_df["cik"] = pd.to_numeric(
+                self.firms_df["cik"].str.strip(), errors="coerce"
+            ).astype("Int64")
+            self.firms_df = self.firms_df.dropna(subset=["cik"])
+
+            # Duplicate CIKs would only repeat the same SEC requests
+            before = len(self.firms_df)
+            self.firms_df = self.firms_df.drop_duplicates(subset=["cik"]).reset_index(
+                drop=True
+            )
+            if len(self.firms_df) < before:
+                logger.info(f"   Dropped {before - len(self.firms_df)} duplicate CIKs")
 
-            print(f"✅ Loaded {len(self.firms_df)} firms")
+            # Batches only need the CIKs, as strings without zero padding to match
+            # the EDGAR indices, so convert them once and slice this array per batch
+            self._ciks = self.firms_df["cik"].astype(str).to_numpy()
+
+            logger.info(f"✅ Loaded {len(self.firms_df)} firms")
 
             # Show sample
-            print(f"\n📋 Sample firms:")
-            display_cols = [
-                col
-                for col in ["cik", "ticker", "company_name"]
-                if col in self.firms_df.columns
-            ]
-            print(self.firms_df[display_cols].head())
+            # Formatting the sample table is skipped entirely when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                display_cols = [
+                    col
+                    for col in ["cik", "ticker", "company_name"]
+                    if col in self.firms_df.columns
+                ]
+                logger.info(f"\n📋 Sample firms:\n{self.firms_df[display_cols].head()}")
 
             return True
 
         except FileNotFoundError:
-            print(f"❌ Error: Input file not found: {self.input_file}")
+            logger.error(f"❌ Error: Input file not found: {self.input_file}")
             return False
         except Exception as e:
-            print(f"❌ Error loading firms: {e}")
+            logger.error(f"❌ Error loading firms: {e}")
             return False
 
     def create_batches(self):
         """Divide firms into batches"""
-        print(f"\n📦 Creating batches (size: {self.batch_size} firms per batch)...")
+        logger.info(
+            f"\n📦 Creating batches (size: {self.batch_size} firms per batch)..."
+        )
 
         total_firms = len(self.firms_df)
         num_batches = (total_firms + self.batch_size - 1) // self.batch_size
@@ -132,95 +248,207 @@ class ColabBatchDownloader:
                 "batch_id": i + 1,
                 "start_idx": start_idx,
                 "end_idx": end_idx,
-                "firms": self.firms_df.iloc[start_idx:end_idx],
+                "firms_count": end_idx - start_idx,
                 "status": "pending",
             }
 
             self.batches.append(batch)
 
-        print(f"✅ Created {len(self.batches)} batches")
-        print(f"   Total firms: {total_firms}")
-        print(f"   Firms per batch: {self.batch_size}")
-        print(f"   Last batch size: {len(self.batches[-1]['firms'])}")
+        logger.info(f"✅ Created {len(self.batches)} batches")
+        logger.info(f"   Total firms: {total_firms}")
+        logger.info(f"   Firms per batch: {self.batch_size}")
+        logger.info(f"   Last batch size: {self.batches[-1]['firms_count']}")
+
+    def _read_progress(self):
+        """
+        Read the append-only progress log into a dict of the latest record per batch
+
+        Each line is one status transition, so the last line seen for a batch wins.
+        Malformed lines are skipped, but if too many of them turn up the log is
+        considered corrupt.
+
+        Returns:
+            dict: batch_id -> latest progress record
+        """
+        latest = {}
+        total_lines = 0
+        corrupt_lines = 0
+
+        with open(self.progress_file, "rb") as f:
+            data = f.read()
+
+        # A partial last line is what a killed session leaves behind; drop it so
+        # the next append starts on a fresh line
+        tail_start = data.rfind(b"\n") + 1
+        if tail_start < len(data):
+            with open(self.progress_file, "r+b") as f:
+                f.truncate(tail_start)
+                os.fsync(f.fileno())
+            data = data[:tail_start]
+
+        for line in data.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            total_lines += 1
+            try:
+                record = _json_loads(line)
+                latest[int(record["batch_id"])] = record
+            except (ValueError, KeyError, TypeError):
+                corrupt_lines += 1
+
+        if corrupt_lines:
+            logger.warning(
+                f"⚠️  Skipped {corrupt_lines} malformed line(s) in {self.progress_file}"
+            )
+            if corrupt_lines / total_lines > MAX_CORRUPT_PROGRESS_RATIO:
+                raise ValueError(
+                    f"{corrupt_lines}/{total_lines} lines in {self.progress_file} are corrupt"
+                )
+
+        return latest
+
+    def _import_legacy_progress(self):
+        """Convert the CSV progress file of earlier versions into the progress log"""
+        progress_df = pd.read_csv(self.legacy_progress_file)
+        lines = []
+        for row in progress_df.to_dict("records"):
+            lines.append(
+                _json_dumps(
+                    {
+                        "batch_id": int(row["batch_id"]),
+                        "status": row["status"],
+                        "timestamp": row.get("timestamp"),
+                        "firms_count": (
+                            int(row["firms_count"])
+                            if pd.notna(row.get("firms_count"))
+                            else None
+                        ),
+                    }
+                )
+                + b"\n"
+            )
+
+        # Written whole and renamed into place, so an interrupted import is simply redone
+        os.makedirs(os.path.dirname(self.progress_file), exist_ok=True)
+        tmp_file = self.progress_file + ".tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(b"".join(lines))
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.progress_file)
+
+        logger.info(
+            f"\n📊 Imported {len(lines)} batches from {self.legacy_progress_file}"
+        )
 
     def load_progress(self):
         """Load progress from previous sessions"""
+        if not os.path.exists(self.progress_file) and os.path.exists(
+            self.legacy_progress_file
+        ):
+            try:
+                self._import_legacy_progress()
+            except Exception as e:
+                logger.warning(
+                    f"⚠️  Warning: Could not import {self.legacy_progress_file}: {e}"
+                )
+
         if not os.path.exists(self.progress_file):
-            print("\n📊 No previous progress found (starting fresh)")
+            logger.info("\n📊 No previous progress found (starting fresh)")
             return
 
-        print(f"\n📊 Loading progress from {self.progress_file}...")
+        logger.info(f"\n📊 Loading progress from {self.progress_file}...")
 
         try:
-            progress_df = pd.read_csv(self.progress_file)
+            self._progress = self._read_progress()
 
-            # Update batch statuses
+            # Update batch statuses with one dict lookup per batch
             for batch in self.batches:
-                batch_progress = progress_df[
-                    progress_df["batch_id"] == batch["batch_id"]
-                ]
+                record = self._progress.get(batch["batch_id"])
+                if record is not None:
+                    batch["status"] = record["status"]
 
-                if len(batch_progress) > 0:
-                    status = batch_progress.iloc[0]["status"]
-                    batch["status"] = status
+            status_counts = Counter(b["status"] for b in self.batches)
+            completed = status_counts["completed"]
+            in_progress = status_counts["in_progress"]
+            pending = status_counts["pending"]
 
-            completed = sum(1 for b in self.batches if b["status"] == "completed")
-            in_progress = sum(1 for b in self.batches if b["status"] == "in_progress")
-            pending = sum(1 for b in self.batches if b["status"] == "pending")
-
-            print(f"✅ Progress loaded:")
-            print(f"   Completed: {completed} batches")
-            print(f"   In Progress: {in_progress} batches")
-            print(f"   Pending: {pending} batches")
+            logger.info(f"✅ Progress loaded:")
+            logger.info(f"   Completed: {completed} batches")
+            logger.info(f"   In Progress: {in_progress} batches")
+            logger.info(f"   Pending: {pending} batches")
 
         except Exception as e:
-            print(f"⚠️  Warning: Could not load progress: {e}")
+            logger.warning(f"⚠️  Warning: Could not load progress: {e}")
 
     def save_progress(self, batch_id, status):
-        """Save progress after each batch"""
+        """Append this batch's status transition to the progress log"""
 
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
 
-        # Load existing progress or create new
-        if os.path.exists(self.progress_file):
-            progress_df = pd.read_csv(self.progress_file)
-        else:
-            progress_df = pd.DataFrame(
-                columns=["batch_id", "status", "timestamp", "firms_count"]
-            )
-
-        # Update or add this batch's status
-        batch_mask = progress_df["batch_id"] == batch_id
         batch_info = self.batches[batch_id - 1]
+        record = {
+            "batch_id": batch_id,
+            "status": status,
+            "timestamp": datetime.now().isoformat(),
+            "firms_count": batch_info["firms_count"],
+        }
+
+        self._progress[batch_id] = record
+
+        # One line per transition, synced right away since a Colab VM can be
+        # preempted at any moment and transitions only happen a few times per batch
+        _append_durably(self.progress_file, _json_dumps(record) + b"\n")
+
+    def load_config(self):
+        """Load config.json once and reuse it for every batch"""
+        if self._config is None:
+            with open(self.config_file, "rb") as f:
+                self._config = _json_loads(f.read())
+        return self._config
+
+    def build_params(self):
+        """Build the in-memory download_filings settings shared by all batches"""
+        params = dict(self.load_config()["download_filings"])
+
+        params["start_year"] = self.start_year
+        params["end_year"] = self.end_year
+        params["filing_types"] = self.filing_types
+        params["user_agent"] = self.user_agent
+        params["max_workers"] = self.max_workers
+
+        return params
+
+    def scan_existing_filings(self):
+        """Collect accession numbers of filings already on disk so they are skipped"""
+        raw_filings_folder = os.path.join(
+            download_filings.DATASET_DIR,
+            self.load_config()["download_filings"]["raw_filings_folder"],
+        )
+        self._existing_accessions = download_filings.scan_downloaded_accessions(
+            raw_filings_folder
+        )
 
-        if batch_mask.any():
-            progress_df.loc[batch_mask, "status"] = status
-            progress_df.loc[batch_mask, "timestamp"] = datetime.now().isoformat()
-        else:
-            new_row = pd.DataFrame(
-                [
-                    {
-                        "batch_id": batch_id,
-                        "status": status,
-                        "timestamp": datetime.now().isoformat(),
-                        "firms_count": len(batch_info["firms"]),
-                    }
-                ]
-            )
-            progress_df = pd.concat([progress_df, new_row], ignore_index=True)
-
-        # Save to file
-        progress_df.to_csv(self.progress_file, index=False)
+        free_gb = shutil.disk_usage(download_filings.DATASET_DIR).free / 1e9
+        logger.info(
+            f"   Already on disk: {len(self._existing_accessions)} filings "
+            f"({free_gb:.1f} GB free)"
+        )
 
     def update_config(self, cik_list):
         """Update config.json with current batch's CIK list"""
-        print(f"\n⚙️  Updating config.json with {len(cik_list)} firms...")
+        # Only the CIK list changes between batches; skip the write if it didn't
+        config_hash = hashlib.blake2b(
+            ",".join(cik_list).encode(), digest_size=8
+        ).hexdigest()
+        if config_hash == self._last_config_hash:
+            return
+
+        logger.info(f"\n⚙️  Updating config.json with {len(cik_list)} firms...")
 
         try:
-            # Load existing config
-            with open(self.config_file, "r") as f:
-                config = json.load(f)
+            config = self.load_config()
 
             # Update download_filings section
             config["download_filings"]["cik_tickers"] = cik_list
@@ -230,54 +458,66 @@ class ColabBatchDownloader:
             config["download_filings"]["user_agent"] = self.user_agent
 
             # Save updated config
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=2)
+            _atomic_write(self.config_file, _json_dumps(config, indent=True))
+            self._last_config_hash = config_hash
 
-            print(f"✅ Config updated")
+            logger.info(f"✅ Config updated")
 
         except Exception as e:
-            print(f"❌ Error updating config: {e}")
+            logger.error(f"❌ Error updating config: {e}")
             raise
 
     def process_batch(self, batch):
         """Process a single batch of firms"""
         batch_id = batch["batch_id"]
-        firms = batch["firms"]
 
-        print("\n" + "=" * 70)
-        print(f"PROCESSING BATCH {batch_id} / {len(self.batches)}")
-        print("=" * 70)
-        print(f"Firms in this batch: {len(firms)}")
-        print(f"Date range: {self.start_year} - {self.end_year}")
-        print(f"Filing types: {', '.join(self.filing_types)}")
-        print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(
+            "\n" + "=" * 70 + "\n"
+            f"PROCESSING BATCH {batch_id} / {len(self.batches)}\n" + "=" * 70 + "\n"
+            f"Firms in this batch: {batch['firms_count']}\n"
+            f"Date range: {self.start_year} - {self.end_year}\n"
+            f"Filing types: {', '.join(self.filing_types)}\n"
+            f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        )
+
+        # Extract CIK list for this batch from the precomputed array
+        cik_list = self._ciks[batch["start_idx"] : batch["end_idx"]].tolist()
 
-        # Extract CIK list for this batch
-        cik_list = firms["cik"].tolist()
+        # Only this batch's CIKs change between runs
+        if self._params is None:
+            self._params = self.build_params()
+            self._session = download_filings.get_session(pool_maxsize=self.max_workers)
+        self._params["cik_tickers"] = cik_list
 
-        # Update config.json with this batch's CIKs
-        self.update_config(cik_list)
+        # Optionally keep a config.json snapshot of this batch
+        if self.write_config:
+            self.update_config(cik_list)
 
         # Mark batch as in progress
         self.save_progress(batch_id, "in_progress")
 
         # Run the original download_filings script
         try:
-            print(f"\n🚀 Starting download process...")
-            download_filings.main()
+            logger.info(f"\n🚀 Starting download process...")
+            download_filings.run_download(
+                self._params,
+                session=self._session,
+                skip_set=self._completed_filings,
+                skip_accessions=self._existing_accessions,
+            )
 
             # Mark batch as completed
             self.save_progress(batch_id, "completed")
 
-            print(f"\n✅ Batch {batch_id} completed successfully!")
+            logger.info(f"\n✅ Batch {batch_id} completed successfully!")
 
         except KeyboardInterrupt:
-            print(f"\n⚠️  Batch {batch_id} interrupted by user")
+            logger.warning(f"\n⚠️  Batch {batch_id} interrupted by user")
             self.save_progress(batch_id, "interrupted")
             raise
 
         except Exception as e:
-            print(f"\n❌ Error in batch {batch_id}: {e}")
+            logger.error(f"\n❌ Error in batch {batch_id}: {e}")
             self.save_progress(batch_id, "failed")
             raise
 
@@ -286,33 +526,37 @@ class ColabBatchDownloader:
         if not os.path.exists(self.progress_file):
             return
 
-        print("\n" + "=" * 70)
-        print("DOWNLOAD SUMMARY")
-        print("=" * 70)
-
-        progress_df = pd.read_csv(self.progress_file)
+        logger.info("\n" + "=" * 70)
+        logger.info("DOWNLOAD SUMMARY")
+        logger.info("=" * 70)
 
         total_batches = len(self.batches)
-        completed = len(progress_df[progress_df["status"] == "completed"])
-        failed = len(progress_df[progress_df["status"] == "failed"])
-        in_progress = len(progress_df[progress_df["status"] == "in_progress"])
+        status_counts = Counter(r["status"] for r in self._progress.values())
+        completed = status_counts["completed"]
+        failed = status_counts["failed"]
+        in_progress = status_counts["in_progress"]
+        # Batches imported from the legacy CSV may have no firms_count
+        completed_firms = sum(
+            r["firms_count"]
+            for r in self._progress.values()
+            if r["status"] == "completed" and r.get("firms_count") is not None
+        )
         pending = total_batches - completed - failed - in_progress
 
-        print(f"\n📊 Batch Status:")
-        print(f"   Total batches: {total_batches}")
-        print(f"   ✅ Completed: {completed} ({completed/total_batches*100:.1f}%)")
-        print(f"   ❌ Failed: {failed}")
-        print(f"   🔄 In Progress: {in_progress}")
-        print(f"   ⏳ Pending: {pending}")
+        logger.info(f"\n📊 Batch Status:")
+        logger.info(f"   Total batches: {total_batches}")
+        logger.info(
+            f"   ✅ Completed: {completed} ({completed/total_batches*100:.1f}%)"
+        )
+        logger.info(f"   ❌ Failed: {failed}")
+        logger.info(f"   🔄 In Progress: {in_progress}")
+        logger.info(f"   ⏳ Pending: {pending}")
 
         total_firms = len(self.firms_df)
-        completed_firms = progress_df[progress_df["status"] == "completed"][
-            "firms_count"
-        ].sum()
 
-        print(f"\n📈 Firm Progress:")
-        print(f"   Total firms: {total_firms}")
-        print(
+        logger.info(f"\n📈 Firm Progress:")
+        logger.info(f"   Total firms: {total_firms}")
+        logger.info(
             f"   Processed: {completed_firms} ({completed_firms/total_firms*100:.1f}%)"
         )
 
@@ -320,18 +564,29 @@ class ColabBatchDownloader:
         metadata_file = "datasets/FILINGS_METADATA.csv"
         if os.path.exists(metadata_file):
             try:
-                metadata_df = pd.read_csv(metadata_file)
-                print(f"\n📄 Downloaded Filings:")
-                print(f"   Total filings: {len(metadata_df)}")
+                # Only the Type column is needed, so stream it in chunks and count
+                # each chunk's categories in one value_counts pass
+                total_filings = 0
+                type_counts = Counter()
+                for chunk in pd.read_csv(
+                    metadata_file,
+                    usecols=["Type"],
+                    dtype={"Type": "category"},
+                    chunksize=200_000,
+                ):
+                    total_filings += len(chunk)
+                    type_counts.update(chunk["Type"].value_counts().to_dict())
+
+                logger.info(f"\n📄 Downloaded Filings:")
+                logger.info(f"   Total filings: {total_filings}")
 
                 for filing_type in self.filing_types:
-                    count = len(metadata_df[metadata_df["Type"] == filing_type])
-                    print(f"   {filing_type}: {count}")
+                    logger.info(f"   {filing_type}: {type_counts[filing_type]}")
 
             except Exception as e:
-                print(f"\n⚠️  Could not read metadata: {e}")
+                logger.warning(f"\n⚠️  Could not read metadata: {e}")
 
-        print("\n" + "=" * 70)
+        logger.info("\n" + "=" * 70)
 
     def run(self, specific_batch_id=None):
         """
@@ -340,14 +595,14 @@ class ColabBatchDownloader:
         Args:
             specific_batch_id: If provided, only process this specific batch
         """
-        print("=" * 70)
-        print("COLAB BATCH DOWNLOADER FOR EDGAR FILINGS")
-        print("=" * 70)
-        print(f"\nConfiguration:")
-        print(f"  Input file: {self.input_file}")
-        print(f"  Batch size: {self.batch_size} firms")
-        print(f"  Year range: {self.start_year} - {self.end_year}")
-        print(f"  Filing types: {', '.join(self.filing_types)}")
+        logger.info("=" * 70)
+        logger.info("COLAB BATCH DOWNLOADER FOR EDGAR FILINGS")
+        logger.info("=" * 70)
+        logger.info(f"\nConfiguration:")
+        logger.info(f"  Input file: {self.input_file}")
+        logger.info(f"  Batch size: {self.batch_size} firms")
+        logger.info(f"  Year range: {self.start_year} - {self.end_year}")
+        logger.info(f"  Filing types: {', '.join(self.filing_types)}")
 
         # Load firms
         if not self.load_firms():
@@ -358,6 +613,12 @@ class ColabBatchDownloader:
 
         # Load previous progress
         self.load_progress()
+        self._completed_filings = download_filings.load_completed_filings()
+        if self._completed_filings:
+            logger.info(
+                f"   Already downloaded: {len(self._completed_filings)} filings (will be skipped)"
+            )
+        self.scan_existing_filings()
 
         # Determine which batches to process
         if specific_batch_id is not None:
@@ -365,35 +626,34 @@ class ColabBatchDownloader:
                 b for b in self.batches if b["batch_id"] == specific_batch_id
             ]
             if not batches_to_process:
-                print(f"\n❌ Batch {specific_batch_id} not found")
+                logger.error(f"\n❌ Batch {specific_batch_id} not found")
                 return False
         else:
-            # Process only pending or failed batches
-            batches_to_process = [
-                b for b in self.batches if b["status"] in ["pending", "failed"]
-            ]
+            # Process everything not completed; batches cut short by a crash or
+            # Ctrl + C resume cheaply since their finished filings are skipped
+            batches_to_process = [b for b in self.batches if b["status"] != "completed"]
 
         if not batches_to_process:
-            print("\n✅ All batches already completed!")
+            logger.info("\n✅ All batches already completed!")
             self.generate_summary()
             return True
 
-        print(f"\n🎯 Will process {len(batches_to_process)} batch(es)")
+        logger.info(f"\n🎯 Will process {len(batches_to_process)} batch(es)")
 
         # Process batches
         start_time = time.time()
 
         try:
             for i, batch in enumerate(batches_to_process):
-                print(f"\n{'='*70}")
-                print(f"Batch {i+1} of {len(batches_to_process)} to process")
-                print(f"{'='*70}")
+                logger.info(f"\n{'='*70}")
+                logger.info(f"Batch {i+1} of {len(batches_to_process)} to process")
+                logger.info(f"{'='*70}")
 
                 self.process_batch(batch)
 
                 # Show progress after each batch
                 elapsed = time.time() - start_time
-                print(f"\n⏱️  Elapsed time: {elapsed/3600:.2f} hours")
+                logger.info(f"\n⏱️  Elapsed time: {elapsed/3600:.2f} hours")
 
                 # Estimate remaining time
                 batches_done = i + 1
@@ -401,29 +661,33 @@ class ColabBatchDownloader:
                 if batches_done > 0:
                     avg_time_per_batch = elapsed / batches_done
                     est_remaining = avg_time_per_batch * batches_remaining
-                    print(
+                    logger.info(
                         f"⏳ Estimated time remaining: {est_remaining/3600:.2f} hours"
                     )
 
         except KeyboardInterrupt:
-            print("\n\n⚠️  Process interrupted by user")
-            print("Progress has been saved. You can resume by running this script again.")
+            logger.warning("\n\n⚠️  Process interrupted by user")
+            logger.info(
+                "Progress has been saved. You can resume by running this script again."
+            )
 
         except Exception as e:
-            print(f"\n\n❌ Process failed: {e}")
-            print("Progress has been saved. You can resume by running this script again.")
+            logger.error(f"\n\n❌ Process failed: {e}")
+            logger.info(
+                "Progress has been saved. You can resume by running this script again."
+            )
 
         # Generate final summary
         self.generate_summary()
 
-        print("\n" + "=" * 70)
-        print("✅ BATCH PROCESSING COMPLETE")
-        print("=" * 70)
+        logger.info("\n" + "=" * 70)
+        logger.info("✅ BATCH PROCESSING COMPLETE")
+        logger.info("=" * 70)
 
-        print(f"\nNext steps:")
-        print(f"1. Check logs/download_progress.csv for detailed status")
-        print(f"2. Review datasets/FILINGS_METADATA.csv for downloaded filings")
-        print(f"3. Run flexible_extractor.py to extract MD&A sections")
+        logger.info(f"\nNext steps:")
+        logger.info(f"1. Check logs/download_progress.jsonl for detailed status")
+        logger.info(f"2. Review datasets/FILINGS_METADATA.csv for downloaded filings")
+        logger.info(f"3. Run flexible_extractor.py to extract MD&A sections")
 
         return True
 
@@ -449,6 +713,9 @@ Examples:
 
     # Download multiple filing types
     python colab_batch_downloader.py --input wrds_data/wrds_identifiers.csv --filing-types 10-K,10-Q
+
+    # Only show warnings and errors
+    python colab_batch_downloader.py --input wrds_data/wrds_identifiers.csv --log-level WARNING
         """,
     )
 
@@ -488,6 +755,27 @@ Examples:
         help="Comma-separated filing types (default: 10-K)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Filings downloaded concurrently, rate-limited to 10 req/s (default: 4)",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Minimum level of progress messages to show (default: INFO)",
+    )
+
+    parser.add_argument(
+        "--write-config",
+        action="store_true",
+        help="Also write each batch's CIK list to config.json (for debugging)",
+    )
+
     parser.add_argument(
         "--user-agent",
         type=str,
@@ -496,6 +784,7 @@ Examples:
     )
 
     args = parser.parse_args()
+    logger.setLevel(args.log_level)
 
     # Parse filing types
     filing_types = [ft.strip() for ft in args.filing_types.split(",")]
@@ -544,6 +833,8 @@ Examples:
         end_year=args.end_year,
         filing_types=filing_types,
         user_agent=user_agent,
+        write_config=args.write_config,
+        max_workers=args.workers,
     )
 
     # Run the batch processing
@@ -16,34 +16,483 @@ Usage:
 
     # Consolidate all items
     python consolidate_output.py --all --filing-type 10-K --output all_items.csv
+
+    # Write Parquet instead of CSV (requires pyarrow)
+    python consolidate_output.py --item 7 --filing-type 10-K --output mda_analysis.parquet
 """
 
 import argparse
 import json
 import os
+import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 from tqdm import tqdm
 
+# orjson decodes several times faster than json (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow backs Parquet/Feather output, fast CSV writing and item text columns (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pcsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pcsv = None
+    pq = None
+
+# pandas 2+ runs .str methods on Arrow-backed columns natively
+ARROW_TEXT = pa is not None and int(pd.__version__.split(".")[0]) >= 2
+
+# Files handed to a worker process at a time; with io_threads, their reads are issued together
+FILE_BATCH_SIZE = 64
+
+# Records held in memory between writes when streaming the output
+STREAM_BATCH_SIZE = 1000
+
+# Index of each JSON file's value offsets, one per filing type. It is kept under logs/
+# so that tools listing the extracted directory only see filings
+INDEX_FILE = os.path.join("logs", ".consolidate_index_{filing_type}.json")
+# Where earlier versions kept the index, inside the extracted directory
+LEGACY_INDEX_FILE = ".index.json"
+INDEX_KEY_PREFIX = b'\n    "'
+# Values closer together than this are fetched with a single read
+INDEX_READ_GAP = 4096
+
+# Filters are first checked against this much of each file, where the metadata sits
+PREFILTER_BYTES = 2048
+FILING_YEAR_RE = re.compile(rb'"filing_date":\s*"(\d{4})')
+CIK_RE = re.compile(rb'"cik":\s*"?0*(\d+)')
+
+# Top-level JSON keys holding item text
+ITEM_KEY_PREFIXES = ("item_", "part_")
+
+# JSON keys of the metadata copied into every record
+RECORD_KEYS = [
+    "cik",
+    "company",
+    "ticker",
+    "filing_type",
+    "filing_date",
+    "period_of_report",
+    "fiscal_year_end",
+    "sic",
+    "state_of_inc",
+    "filename",
+    "filing_html_index",
+]
+
+# Output formats: display name and the pandas function that loads them back
+OUTPUT_FORMATS = {
+    "csv": ("CSV", "pd.read_csv"),
+    "parquet": ("Parquet", "pd.read_parquet"),
+    "feather": ("Feather", "pd.read_feather"),
+}
+
+
+def _read_bytes(json_file):
+    """Read a file's bytes"""
+    with open(json_file, "rb") as f:
+        return f.read()
+
+
+def _read_file(json_file):
+    """Read a file's bytes, returning the OSError instead of raising it"""
+    try:
+        return _read_bytes(json_file)
+    except OSError as e:
+        return e
+
+
+def _parse_batch(json_files, entries, item_keys, io_threads=0, since=None, ciks=None):
+    """
+    Build the output records for a batch of extracted JSON files
+
+    Runs in a worker process, so it lives at module level. With io_threads,
+    all of the batch's reads are in flight at once, which hides per-file
+    latency on slow or network file systems (e.g. a mounted Google Drive).
+
+    Args:
+        json_files: Path strings of the JSON files
+        entries: Each file's sidecar index entry, or None
+        item_keys: (output column, JSON key) pair per item to keep, or None for all items
+        io_threads: Threads reading the batch's files concurrently (0 reads each file when parsed)
+        since: Keep only filings from this year on
+        ciks: Keep only filings of these CIKs (strings without leading zeros)
+
+    Returns:
+        Tuple of the records as a dict of column lists, the number of records,
+        and each file's new index entry (or None)
+    """
+    if io_threads:
+        # Files answered from the index only read a few byte ranges, so skip them
+        to_read = [
+            json_file
+            for json_file, entry in zip(json_files, entries)
+            if entry is None or item_keys is None
+        ]
+        with ThreadPoolExecutor(max_workers=io_threads) as pool:
+            read = dict(zip(to_read, pool.map(_read_file, to_read)))
+        contents = [read.get(json_file) for json_file in json_files]
+    else:
+        contents = [None] * len(json_files)
+
+    results = [
+        _parse_one(json_file, item_keys, content, entry, since, ciks)
+        for json_file, content, entry in zip(json_files, contents, entries)
+    ]
+
+    # Lay the records out column by column here, in parallel, rather than in the parent
+    columns = {}
+    n_rows = 0
+    for record, _ in results:
+        if record is not None:
+            n_rows = _append_row(columns, n_rows, record)
+
+    return columns, n_rows, [entry for _, entry in results]
+
+
+def _scan_item_keys(json_files, entries, since=None, ciks=None):
+    """
+    List the item keys of a batch of extracted JSON files, in first-seen order
+
+    Files with an up-to-date index entry are answered from it; the others are
+    read, but only decoded if their keys cannot be located in the raw bytes.
+
+    Args:
+        json_files: Path strings of the JSON files
+        entries: Each file's sidecar index entry, or None
+        since: Skip filings from before this year
+        ciks: Skip filings of other CIKs (strings without leading zeros)
+
+    Returns:
+        List of the item keys found
+    """
+    keys = {}
+    for json_file, entry in zip(json_files, entries):
+        try:
+            if (since is not None or ciks is not None) and not _prefilter(
+                json_file, None, since, ciks
+            ):
+                continue
+            stat = os.stat(json_file)
+            if (
+                entry is not None
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+            ):
+                offsets = entry["offsets"]
+            else:
+                content = _read_bytes(json_file)
+                offsets = _index_offsets(content) or _json_loads(content)
+        except (OSError, ValueError):
+            continue  # the full pass reports unreadable files
+        keys.update(
+            dict.fromkeys(k for k in offsets if k.startswith(ITEM_KEY_PREFIXES))
+        )
+    return list(keys)
+
+
+def _append_row(columns, n_rows, record):
+    """
+    Append a record to a dict of column lists holding n_rows rows
+
+    Keys seen for the first time get a new column padded with None, and columns
+    the record lacks get None. Returns the new number of rows.
+    """
+    for key, value in record.items():
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [None] * n_rows
+        column.append(value)
+    n_rows += 1
+    if len(columns) != len(record):
+        for column in columns.values():
+            if len(column) < n_rows:
+                column.append(None)
+    return n_rows
+
+
+def _to_frame(columns):
+    """
+    Build a DataFrame from a dict of column lists, emptying the dict
+
+    With pyarrow, item texts are stored as Arrow large_string arrays (one UTF-8
+    buffer plus offsets) instead of a Python str object per filing. Each list is
+    released as soon as its column is converted.
+    """
+    data = {}
+    for key in list(columns):
+        values = columns.pop(key)
+        if ARROW_TEXT and key.startswith(ITEM_KEY_PREFIXES):
+            values = pd.arrays.ArrowExtensionArray(
+                pa.array(values, type=pa.large_string())
+            )
+        data[key] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def _extend_columns(columns, n_rows, more, n_more):
+    """Like _append_row, for a dict of column lists holding n_more rows"""
+    for key, values in more.items():
+        column = columns.get(key)
+        if column is None:
+            column = columns[key] = [None] * n_rows
+        column.extend(values)
+    n_rows += n_more
+    if len(columns) != len(more):
+        for column in columns.values():
+            column.extend([None] * (n_rows - len(column)))
+    return n_rows
+
+
+def _json_loads(data):
+    """Decode JSON bytes, with orjson when available"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _index_offsets(content):
+    """
+    Locate each top-level value of an extracted JSON file
+
+    extract_items writes the files with indent=4, so every top-level key starts
+    a line indented by exactly four spaces; nested values are indented deeper
+    and strings cannot hold raw newlines.
+
+    Returns:
+        Dict mapping key to [start, end) byte offsets of its value, or None if the
+        file is not laid out that way
+    """
+    offsets = {}
+    pos = content.find(INDEX_KEY_PREFIX)
+    while pos != -1:
+        key_start = pos + len(INDEX_KEY_PREFIX)
+        key_end = content.find(b'": ', key_start)
+        if key_end == -1:
+            return None
+        value_start = key_end + 3
+        pos = content.find(INDEX_KEY_PREFIX, value_start)
+        value_end = pos if pos != -1 else content.rfind(b"}")
+        # Drop the separator (and a \r from files written on Windows)
+        while value_end > value_start and content[value_end - 1] in b" \t\r\n,":
+            value_end -= 1
+        offsets[content[key_start:key_end].decode("utf-8")] = [value_start, value_end]
+    return offsets or None
+
+
+def _read_indexed(json_file, keys, offsets):
+    """Decode only the given keys' values using their byte offsets"""
+    spans = sorted((*offsets[key], key) for key in keys if key in offsets)
+    data = {}
+    with open(json_file, "rb") as f:
+        i = 0
+        while i < len(spans):
+            # Fetch neighbouring values (like the metadata at the top) in one read
+            start, end, _ = spans[i]
+            j = i
+            while j + 1 < len(spans) and spans[j + 1][0] - end <= INDEX_READ_GAP:
+                j += 1
+                end = max(end, spans[j][1])
+            f.seek(start)
+            chunk = f.read(end - start)
+            for value_start, value_end, key in spans[i : j + 1]:
+                data[key] = _json_loads(chunk[value_start - start : value_end - start])
+            i = j + 1
+    return data
+
+
+def _keep_filing(cik, year, since=None, ciks=None):
+    """Check a filing's CIK and filing year (either may be None if unknown) against the filters"""
+    if since is not None and year is not None and year < since:
+        return False
+    if ciks is not None and cik is not None and cik not in ciks:
+        return False
+    return True
+
+
+def _prefilter(json_file, content, since, ciks):
+    """Decide from the first bytes of a file, without decoding it, whether it can be skipped"""
+    if isinstance(content, bytes):
+        head = content[:PREFILTER_BYTES]
+    else:
+        try:
+            with open(json_file, "rb") as f:
+                head = f.read(PREFILTER_BYTES)
+        except OSError:
+            return True  # let the full read report the error
+
+    year = FILING_YEAR_RE.search(head)
+    cik = CIK_RE.search(head)
+    return _keep_filing(
+        cik.group(1).decode() if cik else None,
+        int(year.group(1)) if year else None,
+        since,
+        ciks,
+    )
+
+
+def _parse_one(json_file, item_keys, content=None, entry=None, since=None, ciks=None):
+    """
+    Build the output record for one extracted JSON file
+
+    With a specific set of items and an up-to-date index entry, only the needed
+    values are read and decoded. Otherwise the whole file is decoded and a fresh
+    index entry is built from its bytes.
+
+    Args:
+        json_file: Path string of the JSON file
+        item_keys: (output column, JSON key) pair per item to keep, or None for all items
+        content: The file's bytes (or the error reading them) if already read
+        entry: The file's sidecar index entry, if any
+        since: Keep only filings from this year on
+        ciks: Keep only filings of these CIKs (strings without leading zeros)
+
+    Returns:
+        Tuple of the record dict (None if the file could not be read or is
+        filtered out) and the file's new index entry (None if unchanged or unavailable)
+    """
+    new_entry = None
+    try:
+        filtering = since is not None or ciks is not None
+        if filtering and not _prefilter(json_file, content, since, ciks):
+            return None, None
+
+        data = None
+        if entry is not None and item_keys and content is None:
+            stat = os.stat(json_file)
+            if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                keys = RECORD_KEYS + [json_key for _, json_key in item_keys]
+                try:
+                    data = _read_indexed(json_file, keys, entry["offsets"])
+                except (OSError, ValueError):
+                    data = None  # stale or damaged entry: decode the whole file
+
+        if data is None:
+            if isinstance(content, Exception):
+                raise content
+            stat = os.stat(json_file)
+            if content is None:
+                content = _read_bytes(json_file)
+            data = _json_loads(content)
+
+            offsets = _index_offsets(content)
+            if offsets is not None and set(offsets) == set(data):
+                new_entry = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "offsets": offsets,
+                }
+
+        if filtering:
+            # The prefilter passes whatever it cannot find; check the decoded values,
+            # where a missing CIK or date fails the filter
+            cik = str(data.get("cik") or "")
+            year = str(data.get("filing_date") or "")[:4]
+            if not _keep_filing(
+                str(int(cik)) if cik.isdigit() else "",
+                int(year) if year.isdigit() else 0,
+                since,
+                ciks,
+            ):
+                return None, new_entry
+
+        # Base record with metadata
+        record = {
+            "cik": data.get("cik"),
+            "company_name": data.get("company"),
+            "ticker": data.get("ticker", ""),
+            "filing_type": data.get("filing_type"),
+            "filing_date": data.get("filing_date"),
+            "period_of_report": data.get("period_of_report"),
+            "fiscal_year_end": data.get("fiscal_year_end"),
+            "sic": data.get("sic"),
+            "state_of_inc": data.get("state_of_inc"),
+            "filename": data.get("filename"),
+            "filing_url": data.get("filing_html_index"),
+        }
+
+        # Extract specified items
+        if item_keys:
+            for column, json_key in item_keys:
+                record[column] = data.get(json_key, "")
+        else:
+            # Extract all items
+            for key, value in data.items():
+                if key.startswith(ITEM_KEY_PREFIXES):
+                    record[key] = value
+
+        return record, new_entry
+
+    except json.JSONDecodeError as e:  # orjson's error subclasses this
+        print(f"\n⚠️  Error decoding {os.path.basename(json_file)}: {e}")
+        return None, None
+    except Exception as e:
+        print(f"\n⚠️  Error processing {os.path.basename(json_file)}: {e}")
+        return None, None
+
 
 class OutputConsolidator:
     """Consolidates extracted JSON files into CSV"""
 
-    def __init__(self, filing_type="10-K", output_file="consolidated_output.csv"):
+    def __init__(
+        self,
+        filing_type="10-K",
+        output_file="consolidated_output.csv",
+        max_workers=None,
+        io_threads=0,
+        stream=False,
+        output_format=None,
+        use_index=True,
+        lengths=False,
+        since=None,
+        ciks=None,
+    ):
         """
         Initialize consolidator
 
         Args:
             filing_type: Type of filing ('10-K', '10-Q', etc.)
-            output_file: Path to output CSV file
+            output_file: Path to output file
+            max_workers: Number of processes decoding JSON files (default: CPU count)
+            io_threads: Threads per process reading files concurrently (default: 0, sequential)
+            stream: Write records in batches instead of building one DataFrame (default: False)
+            output_format: 'csv', 'parquet' or 'feather' (default: from the output file extension)
+            use_index: Keep an index of value offsets so later runs read only the needed items
+            lengths: Add an <item>_length column per item (default: False)
+            since: Keep only filings filed in or after this year
+            ciks: Keep only filings of these CIKs
         """
         self.filing_type = filing_type
         self.output_file = output_file
+        self.max_workers = max_workers
+        self.io_threads = io_threads
+        self.stream = stream
+        self.output_format = output_format or self._infer_format(output_file)
+        self.use_index = use_index
+        self.lengths = lengths
+        self.since = since
+        self.ciks = {str(int(cik)) for cik in ciks} if ciks else None
         self.extracted_dir = f"datasets/EXTRACTED_FILINGS/{filing_type}"
 
-    def get_item_column_name(self, item):
+    @staticmethod
+    def _infer_format(output_file):
+        """Pick the output format from the file extension, defaulting to CSV"""
+        suffix = Path(output_file).suffix.lower().lstrip(".")
+        return suffix if suffix in OUTPUT_FORMATS else "csv"
+
+    @staticmethod
+    def get_item_column_name(item):
         """
         Convert item number to JSON key name
 
@@ -73,13 +522,42 @@ class OutputConsolidator:
         Returns:
             DataFrame with consolidated data
         """
+        json_files = self._find_json_files()
+        if json_files is None:
+            return None
 
+        items_to_extract = self._items_to_extract(item, items)
+        columns = {}
+        n_rows = 0
+        for batch_columns, batch_rows in self._iter_columns(
+            json_files, items_to_extract
+        ):
+            n_rows = _extend_columns(columns, n_rows, batch_columns, batch_rows)
+
+        if n_rows == 0:
+            print("❌ No records extracted")
+            return None
+
+        # Create DataFrame straight from the column lists
+        df = _to_frame(columns)
+
+        print(f"\n✅ Loaded {len(df)} records")
+
+        return df
+
+    def _find_json_files(self):
+        """List the extracted JSON files, or return None if there are none"""
         if not os.path.exists(self.extracted_dir):
             print(f"❌ Directory not found: {self.extracted_dir}")
             return None
 
-        # Get list of JSON files
-        json_files = list(Path(self.extracted_dir).glob("*.json"))
+        # Get list of JSON files as plain path strings; scandir avoids building Path objects
+        with os.scandir(self.extracted_dir) as entries:
+            json_files = [
+                entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and entry.name != LEGACY_INDEX_FILE
+            ]
 
         if len(json_files) == 0:
             print(f"❌ No JSON files found in {self.extracted_dir}")
@@ -87,7 +565,11 @@ class OutputConsolidator:
 
         print(f"\n📂 Found {len(json_files)} JSON files")
 
-        # Determine which items to extract
+        return json_files
+
+    @staticmethod
+    def _items_to_extract(item=None, items=None):
+        """Determine which items to extract (None for all)"""
         if item:
             items_to_extract = [item]
         elif items:
@@ -101,59 +583,227 @@ class OutputConsolidator:
         else:
             print(f"   Extracting ALL items")
 
-        records = []
-
-        for json_file in tqdm(json_files, desc="Processing files"):
-            try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Base record with metadata
-                record = {
-                    "cik": data.get("cik"),
-                    "company_name": data.get("company"),
-                    "ticker": data.get("ticker", ""),
-                    "filing_type": data.get("filing_type"),
-                    "filing_date": data.get("filing_date"),
-                    "period_of_report": data.get("period_of_report"),
-                    "fiscal_year_end": data.get("fiscal_year_end"),
-                    "sic": data.get("sic"),
-                    "state_of_inc": data.get("state_of_inc"),
-                    "filename": data.get("filename"),
-                    "filing_url": data.get("filing_html_index"),
-                }
-
-                # Extract specified items
-                if items_to_extract:
-                    for item_num in items_to_extract:
-                        col_name = self.get_item_column_name(item_num)
-                        item_text = data.get(col_name, "")
-                        record[f"item_{item_num}"] = item_text
+        return items_to_extract
+
+    def _iter_columns(self, json_files, items_to_extract):
+        """Yield the records of each batch of files as (dict of column lists, row count)"""
+        # Files are independent, so decode them in batches across worker processes
+        batches = [
+            json_files[i : i + FILE_BATCH_SIZE]
+            for i in range(0, len(json_files), FILE_BATCH_SIZE)
+        ]
+        index = self._load_index() if self.use_index else {}
+        entry_batches = [
+            [index.get(os.path.basename(f)) for f in batch] for batch in batches
+        ]
+        # Map the items to their output columns and JSON keys once, not per file
+        item_keys = None
+        if items_to_extract:
+            item_keys = [
+                (f"item_{item_num}", self.get_item_column_name(item_num))
+                for item_num in items_to_extract
+            ]
+        parse = partial(
+            _parse_batch,
+            item_keys=item_keys,
+            io_threads=self.io_threads,
+            since=self.since,
+            ciks=self.ciks,
+        )
+        new_entries = {}
+        # Redraw the bar at most twice a second and every ~0.2% of files
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor, tqdm(
+            total=len(json_files),
+            desc="Processing files",
+            mininterval=0.5,
+            miniters=max(1, len(json_files) // 500),
+        ) as pbar:
+            for batch, (columns, n_rows, entries) in zip(
+                batches, executor.map(parse, batches, entry_batches)
+            ):
+                for json_file, entry in zip(batch, entries):
+                    if entry is not None:
+                        new_entries[os.path.basename(json_file)] = entry
+                if n_rows:
+                    yield columns, n_rows
+                pbar.update(len(batch))
+
+        if self.use_index:
+            names = {os.path.basename(f) for f in json_files}
+            if new_entries or any(name not in names for name in index):
+                index = {name: e for name, e in index.items() if name in names}
+                index.update(new_entries)
+                self._save_index(index)
+
+    def _scan_item_columns(self, json_files):
+        """List every item key present in the files, so a streamed output can hold them all"""
+        batches = [
+            json_files[i : i + FILE_BATCH_SIZE]
+            for i in range(0, len(json_files), FILE_BATCH_SIZE)
+        ]
+        index = self._load_index() if self.use_index else {}
+        entry_batches = [
+            [index.get(os.path.basename(f)) for f in batch] for batch in batches
+        ]
+        scan = partial(_scan_item_keys, since=self.since, ciks=self.ciks)
+        keys = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for batch_keys in executor.map(scan, batches, entry_batches):
+                keys.update(dict.fromkeys(batch_keys))
+        return list(keys)
+
+    def _index_path(self):
+        """Path of the offset index"""
+        return INDEX_FILE.format(filing_type=self.filing_type)
+
+    def _load_index(self):
+        """Load the offset index, or an empty one if missing or unreadable"""
+        try:
+            with open(self._index_path(), "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index):
+        """Replace the offset index; failing to write it is not fatal"""
+        tmp_path = self._index_path() + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(tmp_path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(index))
                 else:
-                    # Extract all items
-                    for key, value in data.items():
-                        if key.startswith("item_") or key.startswith("part_"):
-                            record[key] = value
+                    f.write(json.dumps(index).encode("utf-8"))
+            os.replace(tmp_path, self._index_path())
+        except OSError as e:
+            print(f"\n⚠️  Could not write offset index: {e}")
+            return
+
+        # Drop an index left in the extracted directory by earlier versions
+        try:
+            os.remove(os.path.join(self.extracted_dir, LEGACY_INDEX_FILE))
+        except OSError:
+            pass
+
+    def stream_to_file(self, item=None, items=None, load_all=False):
+        """
+        Write records to the output file batch by batch
 
-                records.append(record)
+        Only STREAM_BATCH_SIZE records are held in memory at a time. Columns are
+        fixed by the first batch; later records are aligned to them. When loading
+        all items, the files' item keys are scanned first so that items which only
+        appear in later batches still get a column. CSV is appended to; Parquet
+        and Feather go through pyarrow's incremental writers.
 
-            except json.JSONDecodeError as e:
-                print(f"\n⚠️  Error decoding {json_file.name}: {e}")
-                continue
-            except Exception as e:
-                print(f"\n⚠️  Error processing {json_file.name}: {e}")
-                continue
+        Args:
+            item: Single item to extract (e.g., '7')
+            items: List of items to extract (e.g., ['1', '1A', '7'])
+            load_all: If True, load all items from all files
 
-        if len(records) == 0:
+        Returns:
+            Summary stats accumulated over all batches, or None if nothing was written
+        """
+        json_files = self._find_json_files()
+        if json_files is None:
+            return None
+        items_to_extract = self._items_to_extract(item, items)
+        item_columns = []
+        if not items_to_extract:
+            item_columns = self._scan_item_columns(json_files)
+
+        Path(self.output_file).parent.mkdir(parents=True, exist_ok=True)
+        print(f"\n💾 Streaming to {self.output_file}...")
+
+        columns = None
+        schema = None
+        writer = None
+        stats = None
+        pending = {}
+        n_pending = 0
+
+        def flush():
+            nonlocal columns, schema, writer, stats, pending, n_pending
+            if columns is None:
+                columns = list(pending)
+                columns += [c for c in item_columns if c not in pending]
+            # Pad the columns this batch lacks before conversion, so they get the same types
+            for c in columns:
+                if c not in pending:
+                    pending[c] = [None] * n_pending
+            if len(pending) > len(columns):
+                # Only possible if files changed after the item keys were scanned
+                known = set(columns)
+                unknown = [c for c in pending if c not in known]
+                print(
+                    f"\n⚠️  Dropping columns missing from the output schema: {', '.join(unknown)}"
+                )
+            df = _to_frame({c: pending[c] for c in columns})
+            df, _ = self._derive_columns(df, self.lengths)
+
+            # pyarrow's writers convert in C++; without pyarrow, CSV is appended by pandas
+            if pa is not None:
+                if writer is None:
+                    derived = set(df.columns) - set(columns)
+                    fields = []
+                    for c in df.columns:
+                        if c in derived:
+                            fields.append((c, pa.int64()))
+                        elif c.startswith(ITEM_KEY_PREFIXES):
+                            fields.append((c, pa.large_string()))
+                        else:
+                            fields.append((c, pa.string()))
+                    schema = pa.schema(fields)
+                    if self.output_format == "parquet":
+                        writer = pq.ParquetWriter(
+                            self.output_file, schema, compression="zstd"
+                        )
+                    elif self.output_format == "csv":
+                        writer = pcsv.CSVWriter(self.output_file, schema)
+                    else:
+                        writer = pa.ipc.new_file(
+                            self.output_file,
+                            schema,
+                            options=pa.ipc.IpcWriteOptions(compression="zstd"),
+                        )
+                writer.write_table(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
+            else:
+                first = stats is None
+                df.to_csv(
+                    self.output_file,
+                    mode="w" if first else "a",
+                    header=first,
+                    index=False,
+                    encoding="utf-8",
+                )
+
+            stats = self._merge_stats(stats, self._summarize(df))
+            pending = {}
+            n_pending = 0
+
+        try:
+            for batch_columns, batch_rows in self._iter_columns(
+                json_files, items_to_extract
+            ):
+                n_pending = _extend_columns(
+                    pending, n_pending, batch_columns, batch_rows
+                )
+                if n_pending >= STREAM_BATCH_SIZE:
+                    flush()
+            if n_pending:
+                flush()
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if stats is None:
             print("❌ No records extracted")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(records)
+        print(f"\n✅ Streamed {stats['records']} records")
 
-        print(f"\n✅ Loaded {len(df)} records")
-
-        return df
+        return stats
 
     def add_derived_columns(self, df):
         """
@@ -167,27 +817,45 @@ class OutputConsolidator:
         """
         print("\n🔧 Adding derived columns...")
 
+        df, n_added = self._derive_columns(df, self.lengths)
+
+        print(f"   Added {n_added} derived columns")
+
+        return df
+
+    @staticmethod
+    def _year(dates):
+        """Year of YYYY-MM-DD date strings (NaN if missing or malformed)"""
+        # A fixed format skips per-value format inference
+        return pd.to_datetime(dates, format="%Y-%m-%d", errors="coerce").dt.year
+
+    @staticmethod
+    def _derive_columns(df, lengths=False):
+        """Add the derived columns, returning the DataFrame and the number added"""
+        n_columns = len(df.columns)
+
         # Extract year from filing_date
         if "filing_date" in df.columns:
-            df["filing_year"] = pd.to_datetime(df["filing_date"]).dt.year
+            df["filing_year"] = OutputConsolidator._year(df["filing_date"])
 
         # Extract year from period_of_report
         if "period_of_report" in df.columns:
-            df["fiscal_year"] = pd.to_datetime(df["period_of_report"]).dt.year
-
-        # Text length for each item (useful for quality checks)
-        item_cols = [col for col in df.columns if col.startswith("item_") or col.startswith("part_")]
+            df["fiscal_year"] = OutputConsolidator._year(df["period_of_report"])
 
-        for col in item_cols:
-            df[f"{col}_length"] = df[col].str.len()
+        # Text length for each item, if asked for; the summary computes lengths itself
+        if lengths:
+            item_cols = [col for col in df.columns if col.startswith(ITEM_KEY_PREFIXES)]
 
-        print(f"   Added {len(item_cols) + 2} derived columns")
+            # Attach all length columns at once; inserting them one by one fragments the frame
+            length_cols = {f"{col}_length": df[col].str.len() for col in item_cols}
+            if length_cols:
+                df = pd.concat([df, pd.DataFrame(length_cols, index=df.index)], axis=1)
 
-        return df
+        return df, len(df.columns) - n_columns
 
     def save_to_csv(self, df):
         """
-        Save DataFrame to CSV file
+        Save DataFrame to the output file as CSV, Parquet or Feather
 
         Args:
             df: DataFrame to save
@@ -198,75 +866,164 @@ class OutputConsolidator:
         output_path = Path(self.output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to CSV
+        # Columnar formats store the long item texts compressed and reload much faster
+        if self.output_format == "parquet":
+            df.to_parquet(
+                self.output_file, index=False, compression="zstd", engine="pyarrow"
+            )
+        elif self.output_format == "feather":
+            df.to_feather(self.output_file, compression="zstd")
+        else:
+            self._write_csv(df)
+
+        self._report_saved(len(df), len(df.columns))
+
+    def _write_csv(self, df):
+        """Write CSV with pyarrow's multi-threaded writer, or pandas without it"""
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+            except pa.ArrowException:
+                table = None  # a column Arrow cannot type; pandas writes anything
+            if table is not None:
+                pcsv.write_csv(table, self.output_file)
+                return
         df.to_csv(self.output_file, index=False, encoding="utf-8")
 
+    def _report_saved(self, n_records, n_columns):
+        """Print the size of the written output file"""
         # Get file size
-        file_size = output_path.stat().st_size
+        file_size = Path(self.output_file).stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
-        print(f"✅ Saved {len(df)} records to {self.output_file}")
+        print(f"✅ Saved {n_records} records to {self.output_file}")
         print(f"   File size: {file_size_mb:.2f} MB")
-        print(f"   Columns: {len(df.columns)}")
+        print(f"   Columns: {n_columns}")
 
     def generate_summary_stats(self, df):
         """Generate summary statistics"""
+        self._print_summary(self._summarize(df))
+
+    @staticmethod
+    def _summarize(df):
+        """
+        Compute the summary statistics of a DataFrame
+
+        The stats only hold counts and sums, so those of several batches can be
+        combined with _merge_stats.
+        """
+        stats = {
+            "records": len(df),
+            "columns": len(df.columns),
+            "ciks": None,
+            "missing_cik": None,
+            "missing_date": None,
+            "years": None,
+            "items": {},
+        }
+
+        if "cik" in df.columns:
+            stats["ciks"] = set(df["cik"].dropna())
+            stats["missing_cik"] = df["cik"].isna().sum()
+
+        if "filing_date" in df.columns:
+            stats["missing_date"] = df["filing_date"].isna().sum()
+
+        if "filing_year" in df.columns:
+            stats["years"] = Counter(dict(df["filing_year"].value_counts().items()))
+
+        # Item statistics: non-empty count and total length of the non-empty texts
+        item_cols = [col for col in df.columns if (col.startswith("item_") or col.startswith("part_")) and not col.endswith("_length")]
+
+        for col in item_cols:
+            if pa is not None and hasattr(df[col].array, "__arrow_array__"):
+                # Arrow-backed text: no boolean masks. The null count is kept in
+                # the array's metadata, so only empty strings need a kernel pass;
+                # nulls and empty strings add nothing to the length sum.
+                texts = pa.array(df[col].array)
+                empty = texts.null_count
+                if empty < len(texts):
+                    empty += pc.sum(pc.equal(texts, "")).as_py() or 0
+                count = len(texts) - empty
+                length_sum = pc.sum(pc.utf8_length(texts)).as_py() or 0
+            else:
+                non_empty = df[col].notna() & (df[col] != "")
+                count = non_empty.sum()
+                length_sum = df.loc[non_empty, col].str.len().sum()
+            stats["items"][col] = [count, length_sum]
+
+        return stats
+
+    @staticmethod
+    def _merge_stats(total, stats):
+        """Add the summary stats of one batch to the running total"""
+        if total is None:
+            return stats
+
+        total["records"] += stats["records"]
+        for key in ("missing_cik", "missing_date"):
+            if stats[key] is not None:
+                total[key] += stats[key]
+        if stats["ciks"] is not None:
+            total["ciks"] |= stats["ciks"]
+        if stats["years"] is not None:
+            total["years"] += stats["years"]
+        for col, (count, length_sum) in stats["items"].items():
+            item = total["items"].setdefault(col, [0, 0])
+            item[0] += count
+            item[1] += length_sum
+
+        return total
+
+    def _print_summary(self, stats):
+        """Print summary statistics"""
+        n_records = stats["records"]
+
         print("\n" + "=" * 70)
         print("SUMMARY STATISTICS")
         print("=" * 70)
 
         print(f"\n📊 Dataset Overview:")
-        print(f"   Total records: {len(df):,}")
-        print(f"   Total columns: {len(df.columns)}")
+        print(f"   Total records: {n_records:,}")
+        print(f"   Total columns: {stats['columns']}")
 
-        if "cik" in df.columns:
-            print(f"   Unique firms: {df['cik'].nunique():,}")
+        if stats["ciks"] is not None:
+            print(f"   Unique firms: {len(stats['ciks']):,}")
 
-        if "filing_year" in df.columns:
+        if stats["years"] is not None:
             print(f"\n📅 Date Range:")
-            print(f"   Earliest filing: {df['filing_year'].min()}")
-            print(f"   Latest filing: {df['filing_year'].max()}")
+            print(f"   Earliest filing: {min(stats['years'], default=float('nan'))}")
+            print(f"   Latest filing: {max(stats['years'], default=float('nan'))}")
 
             print(f"\n📈 Filings by Year:")
-            year_counts = df["filing_year"].value_counts().sort_index()
-            for year, count in year_counts.items():
+            for year, count in sorted(stats["years"].items()):
                 print(f"   {year}: {count:,}")
 
-        # Item statistics
-        item_cols = [col for col in df.columns if (col.startswith("item_") or col.startswith("part_")) and not col.endswith("_length")]
-
-        if len(item_cols) > 0:
+        if len(stats["items"]) > 0:
             print(f"\n📋 Extracted Items:")
-            for col in item_cols:
-                non_empty = df[col].notna() & (df[col] != "")
-                count = non_empty.sum()
-                pct = count / len(df) * 100
+            for col, (count, length_sum) in stats["items"].items():
+                pct = count / n_records * 100
 
                 # Get average length
-                if f"{col}_length" in df.columns:
-                    avg_length = df.loc[non_empty, f"{col}_length"].mean()
-                    print(
-                        f"   {col}: {count:,} ({pct:.1f}%) | Avg length: {avg_length:,.0f} chars"
-                    )
-                else:
-                    print(f"   {col}: {count:,} ({pct:.1f}%)")
+                avg_length = length_sum / count if count else float("nan")
+                print(
+                    f"   {col}: {count:,} ({pct:.1f}%) | Avg length: {avg_length:,.0f} chars"
+                )
 
         # Data quality checks
         print(f"\n🔍 Data Quality:")
 
-        if "cik" in df.columns:
-            missing_cik = df["cik"].isna().sum()
-            print(f"   Missing CIK: {missing_cik}")
+        if stats["missing_cik"] is not None:
+            print(f"   Missing CIK: {stats['missing_cik']}")
 
-        if "filing_date" in df.columns:
-            missing_date = df["filing_date"].isna().sum()
-            print(f"   Missing filing date: {missing_date}")
+        if stats["missing_date"] is not None:
+            print(f"   Missing filing date: {stats['missing_date']}")
 
         # Check for empty item content
-        for col in item_cols:
-            empty_count = ((df[col].isna()) | (df[col] == "")).sum()
+        for col, (count, _) in stats["items"].items():
+            empty_count = n_records - count
             if empty_count > 0:
-                print(f"   Empty {col}: {empty_count} ({empty_count/len(df)*100:.1f}%)")
+                print(f"   Empty {col}: {empty_count} ({empty_count/n_records*100:.1f}%)")
 
         print("\n" + "=" * 70)
 
@@ -285,29 +1042,49 @@ class OutputConsolidator:
         print(f"\nConfiguration:")
         print(f"  Filing type: {self.filing_type}")
         print(f"  Output file: {self.output_file}")
+        if self.since is not None:
+            print(f"  Filed since: {self.since}")
+        if self.ciks is not None:
+            print(f"  CIKs: {len(self.ciks)}")
 
-        # Load JSON files
-        df = self.load_json_files(item=item, items=items, load_all=load_all)
-
-        if df is None or len(df) == 0:
-            print("\n❌ No data to consolidate")
+        if self.output_format != "csv" and pa is None:
+            print(f"\n❌ {self.output_format} output requires pyarrow")
             return False
 
-        # Add derived columns
-        df = self.add_derived_columns(df)
+        if self.stream:
+            # Write batch by batch; the summary comes from the accumulated stats
+            stats = self.stream_to_file(item=item, items=items, load_all=load_all)
+
+            if stats is None:
+                print("\n❌ No data to consolidate")
+                return False
+
+            self._print_summary(stats)
+            self._report_saved(stats["records"], stats["columns"])
+        else:
+            # Load JSON files
+            df = self.load_json_files(item=item, items=items, load_all=load_all)
+
+            if df is None or len(df) == 0:
+                print("\n❌ No data to consolidate")
+                return False
+
+            # Add derived columns
+            df = self.add_derived_columns(df)
 
-        # Generate summary
-        self.generate_summary_stats(df)
+            # Generate summary
+            self.generate_summary_stats(df)
 
-        # Save to CSV
-        self.save_to_csv(df)
+            # Save to CSV
+            self.save_to_csv(df)
 
         print("\n" + "=" * 70)
         print("✅ CONSOLIDATION COMPLETE")
         print("=" * 70)
 
         print(f"\nNext steps:")
-        print(f"1. Load the CSV file: pd.read_csv('{self.output_file}')")
+        format_name, reader = OUTPUT_FORMATS[self.output_format]
+        print(f"1. Load the {format_name} file: {reader}('{self.output_file}')")
         print(f"2. Begin your analysis!")
 
         return True
@@ -334,6 +1111,12 @@ Examples:
 
     # Consolidate 10-Q MD&A
     python consolidate_output.py --item part_1__2 --filing-type 10-Q --output 10q_mda.csv
+
+    # Write compressed Parquet (or --format feather), much faster to reload
+    python consolidate_output.py --item 7 --output mda_analysis.parquet
+
+    # Only filings since 2015 from two firms (others are skipped before decoding)
+    python consolidate_output.py --item 7 --since 2015 --cik 320193,789019 --output mda_subset.csv
         """,
     )
 
@@ -356,6 +1139,57 @@ Examples:
         help="Output CSV file path",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to decode JSON files (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=0,
+        help="Threads per process reading files concurrently; helps on Google Drive (default: 0)",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write records in batches to keep memory flat",
+    )
+
+    parser.add_argument(
+        "--since",
+        type=int,
+        help="Only include filings filed in or after this year (e.g. 2015)",
+    )
+
+    parser.add_argument(
+        "--cik",
+        type=str,
+        help="Only include these firms (comma-separated CIKs)",
+    )
+
+    parser.add_argument(
+        "--lengths",
+        action="store_true",
+        help="Add an <item>_length column with each item's character count",
+    )
+
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not read or write the offset index kept under logs/",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=list(OUTPUT_FORMATS),
+        default=None,
+        help="Output format (default: from the --output extension, else csv)",
+    )
+
     args = parser.parse_args()
 
     # Validate arguments
@@ -373,7 +1207,16 @@ Examples:
 
     # Create consolidator
     consolidator = OutputConsolidator(
-        filing_type=args.filing_type, output_file=args.output
+        filing_type=args.filing_type,
+        output_file=args.output,
+        max_workers=args.workers,
+        io_threads=args.io_threads,
+        stream=args.stream,
+        output_format=args.format,
+        use_index=not args.no_index,
+        lengths=args.lengths,
+        since=args.since,
+        ciks=[cik.strip() for cik in args.cik.split(",")] if args.cik else None,
     )
 
     # Run consolidation
@@ -6,9 +6,12 @@ import os
 import re
 import shutil
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple, Union
 
 import pandas as pd
 import requests
@@ -24,6 +27,12 @@ from requests.exceptions import (
 from tqdm import tqdm
 from urllib3.util import Retry
 
+# orjson serializes straight to UTF-8 bytes, much faster than json (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from logger import Logger
 
 # Python version compatibility for HTML parser
@@ -50,28 +59,105 @@ LOGGER = Logger(
 # Log where the logs are being saved
 LOGGER.info(f"Saving log to {os.path.join(LOGGING_DIR)}\n")
 
+# SEC fair access policy allows at most 10 requests per second per User-Agent
+SEC_REQUESTS_PER_SECOND = 10
 
-def main():
+
+class RateLimiter:
     """
-    Orchestrates the entire flow of crawling and downloading filings from SEC EDGAR.
+    Token bucket shared by all download threads to stay under SEC's request rate.
 
-    This function performs the following steps:
-    1. Loads the configuration file.
-    2. Creates necessary directories.
-    3. Filters out the unnecessary years.
-    4. Downloads the indices.
-    5. Gets specific indices according to the provided filing types and CIKs/tickers.
-    6. Compares the new indices with the old ones to download only the new filings.
-    7. Crawls through each index to download (.tsv files) and save the filing.
+    Args:
+            rate (float): Number of requests allowed per second.
+    """
 
-    Raises:
-            SystemExit: If no filing types are provided or if there are no new filings to download.
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.rate, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(SEC_REQUESTS_PER_SECOND)
+
+# Append-only log of (CIK, accession) pairs already downloaded, used to resume at filing level
+COMPLETED_FILINGS_FILE = os.path.join(LOGGING_DIR, "completed_filings.jsonl")
+
+# fsync the completed filings log after this many new entries
+COMPLETED_FILINGS_FSYNC_EVERY = 100
+
+# Shared keep-alive session for all SEC requests, created on first use by get_session()
+SESSION = None
+SESSION_LOCK = threading.Lock()
+
+# crawl() does a read-modify-write of companies_info.json, which must not interleave across threads
+COMPANIES_INFO_LOCK = threading.Lock()
+
+
+def main():
+    """
+    Loads the configuration file and runs the download with it.
+
+    See run_download for the steps performed.
     """
 
     # Load the configuration file
     with open("config.json") as fin:
         config = json.load(fin)["download_filings"]
 
+    run_download(config)
+
+
+def run_download(
+    config: dict,
+    session: Optional[requests.Session] = None,
+    skip_set: Optional[Set[Tuple[str, str]]] = None,
+    skip_accessions: Optional[Set[str]] = None,
+) -> None:
+    """
+    Orchestrates the entire flow of crawling and downloading filings from SEC EDGAR.
+
+    This function performs the following steps:
+    1. Creates necessary directories.
+    2. Filters out the unnecessary years.
+    3. Downloads the indices.
+    4. Gets specific indices according to the provided filing types and CIKs/tickers.
+    5. Compares the new indices with the old ones to download only the new filings.
+    6. Crawls through each index to download (.tsv files) and save the filing.
+
+    Unlike main, the configuration is passed in memory, so callers running many
+    downloads (e.g. colab_batch_downloader.py) don't need to rewrite config.json.
+
+    Args:
+            config (dict): The "download_filings" section of config.json.
+            session (Optional[requests.Session]): Session to send requests with, so callers can reuse
+                    connections across runs. Defaults to the shared session from get_session().
+            skip_set (Optional[Set[Tuple[str, str]]]): (CIK, accession number) pairs that were already downloaded,
+                    e.g. from load_completed_filings(). These are skipped without any request, and newly
+                    downloaded filings are added to the set.
+            skip_accessions (Optional[Set[str]]): Accession numbers of filings already on disk, e.g. from
+                    scan_downloaded_accessions(). Skipped without any request when a checkpoint or metadata
+                    row confirms them (see drop_downloaded_filings), and updated as filings finish.
+    """
+
+    max_workers = config.get("max_workers", 1)
+    session = session or get_session(pool_maxsize=max_workers)
+
     # Define the directories and filepaths
     raw_filings_folder = os.path.join(DATASET_DIR, config["raw_filings_folder"])
     indices_folder = os.path.join(DATASET_DIR, config["indices_folder"])
@@ -82,7 +168,7 @@ def main():
     # Check if at least one filing type is provided
     if len(config["filing_types"]) == 0:
         LOGGER.info("Please provide at least one filing type")
-        exit()
+        return
 
     # If the indices and/or download folder doesn't exist, create them
     if not os.path.isdir(indices_folder):
@@ -109,6 +195,7 @@ def main():
         skip_present_indices=config["skip_present_indices"],
         indices_folder=indices_folder,
         user_agent=config["user_agent"],
+        session=session,
     )
 
     # Filter out the indices of years that are not in the provided range
@@ -126,6 +213,7 @@ def main():
         filing_types=config["filing_types"],
         cik_tickers=config["cik_tickers"],
         user_agent=config["user_agent"],
+        session=session,
     )
 
     # Initialize list for old filings metadata
@@ -162,7 +250,7 @@ def main():
             LOGGER.info(
                 "\nThere are no more filings to download for the given years, quarters and companies"
             )
-            exit()
+            return
 
         # Concatenate the series to be downloaded
         df = (
@@ -171,6 +259,15 @@ def main():
             else series_to_download[0]
         )
 
+    # Drop filings that were already downloaded in a previous run, before any request is made
+    if skip_set or skip_accessions:
+        df = drop_downloaded_filings(df, skip_set, skip_accessions, old_df)
+        if len(df) == 0:
+            LOGGER.info(
+                "\nAll filings for the given years, quarters and companies were already downloaded"
+            )
+            return
+
     # Create a list for each series in the dataframe
     list_of_series = []
     for i in range(len(df)):
@@ -178,41 +275,76 @@ def main():
 
     LOGGER.info(f"\nDownloading {len(df)} filings directly from EDGAR...\n")
 
-    # Initialize list for final series
-    final_series = []
-    for series in tqdm(list_of_series, ncols=100):
-        # Crawl each series to download and save the filing
-        series = crawl(
-            series=series,
-            filing_types=config["filing_types"],
-            raw_filings_folder=raw_filings_folder,
-            user_agent=config["user_agent"],
-        )
-
-        # If the series was successfully downloaded, append it to the final series
-        if series is not None:
-            final_series.append((series.to_frame()).T)
-            # Concatenate the final series and export it to the metadata file
-            final_df = (
-                pd.concat(final_series) if (len(final_series) > 1) else final_series[0]
+    # Crawl filings concurrently; the shared rate limiter keeps the pool under SEC's limit.
+    # Results are collected on this thread, so only it writes the metadata file.
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    completed_log = open(COMPLETED_FILINGS_FILE, "ab", buffering=0)
+    try:
+        futures = [
+            executor.submit(
+                crawl,
+                series=series,
+                filing_types=config["filing_types"],
+                raw_filings_folder=raw_filings_folder,
+                user_agent=config["user_agent"],
+                session=session,
             )
-            if len(old_df) > 0:
-                final_df = pd.concat([old_df, final_df])
+            for series in list_of_series
+        ]
+
+        # Initialize list for final series
+        final_series = []
+        for future in tqdm(as_completed(futures), total=len(futures), ncols=100):
+            series = future.result()
+
+            # If the series was successfully downloaded, append it to the final series
+            if series is not None:
+                final_series.append((series.to_frame()).T)
+                # Concatenate the final series and export it to the metadata file
+                final_df = (
+                    pd.concat(final_series)
+                    if (len(final_series) > 1)
+                    else final_series[0]
+                )
+                if len(old_df) > 0:
+                    final_df = pd.concat([old_df, final_df])
+
+                # Write to a temporary file first, in order to avoid possible data loss (issue #19)
+                temp_filepath = f"{filings_metadata_filepath}.tmp"
+                try:
+                    final_df.to_csv(temp_filepath, index=False, header=True)
+
+                    # Move the temporary file to the final file
+                    shutil.move(temp_filepath, filings_metadata_filepath)
+                except KeyboardInterrupt:
+                    final_df.to_csv(temp_filepath, index=False, header=True)
+                    shutil.move(temp_filepath, filings_metadata_filepath)
+                    LOGGER.info(
+                        f"Keyboard interrupt by the user detected (Ctrl + C). Saving filings metadata to {filings_metadata_filepath} and exiting."
+                    )
+                    exit(0)
 
-            # Write to a temporary file first, in order to avoid possible data loss (issue #19)
-            temp_filepath = f"{filings_metadata_filepath}.tmp"
-            try:
-                final_df.to_csv(temp_filepath, index=False, header=True)
-
-                # Move the temporary file to the final file
-                shutil.move(temp_filepath, filings_metadata_filepath)
-            except KeyboardInterrupt:
-                final_df.to_csv(temp_filepath, index=False, header=True)
-                shutil.move(temp_filepath, filings_metadata_filepath)
-                LOGGER.info(
-                    f"Keyboard interrupt by the user detected (Ctrl + C). Saving filings metadata to {filings_metadata_filepath} and exiting."
+                # Checkpoint this filing so a rerun never requests it again
+                key = (
+                    series["CIK"],
+                    accession_from_link(series["complete_text_file_link"]),
+                )
+                completed_log.write(
+                    json_line(
+                        {"cik": key[0], "accession": key[1], "type": series["Type"]}
+                    )
                 )
-                exit(0)
+                if len(final_series) % COMPLETED_FILINGS_FSYNC_EVERY == 0:
+                    os.fsync(completed_log.fileno())
+                if skip_set is not None:
+                    skip_set.add(key)
+                if skip_accessions is not None:
+                    skip_accessions.add(key[1])
+    finally:
+        # Don't start queued crawls after an error or Ctrl + C
+        executor.shutdown(wait=False, cancel_futures=True)
+        os.fsync(completed_log.fileno())
+        completed_log.close()
 
     LOGGER.info(f"\nFilings metadata exported to {filings_metadata_filepath}")
     # If some filings failed to download, notify to rerun the script
@@ -223,6 +355,134 @@ def main():
         )
 
 
+def json_line(record: dict) -> bytes:
+    """
+    Serializes a record as one JSON line, using orjson when it is installed.
+
+    Args:
+            record (dict): The record to serialize.
+
+    Returns:
+            bytes: The UTF-8 encoded JSON, terminated by a newline.
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + "\n").encode()
+
+
+def accession_from_link(link: str) -> str:
+    """
+    Extracts the accession number from a complete submission text file link.
+
+    Args:
+            link (str): e.g. "https://www.sec.gov/Archives/edgar/data/320193/0000320193-23-000106.txt"
+
+    Returns:
+            str: The accession number, e.g. "0000320193-23-000106".
+    """
+    return os.path.splitext(os.path.basename(link))[0]
+
+
+def drop_downloaded_filings(
+    df: pd.DataFrame,
+    skip_set: Optional[Set[Tuple[str, str]]] = None,
+    skip_accessions: Optional[Set[str]] = None,
+    old_df: Union[pd.DataFrame, list] = (),
+) -> pd.DataFrame:
+    """
+    Drops the filings that a previous run already downloaded.
+
+    A filing is dropped if its (CIK, accession number) pair is checkpointed in skip_set.
+    A file found on disk (skip_accessions) is only trusted if its accession number is also
+    checkpointed or recorded in the filings metadata, since a run that was killed mid-write
+    may have left an incomplete file behind.
+
+    Args:
+            df (pd.DataFrame): The filings to download, with "CIK" and "complete_text_file_link" columns.
+            skip_set (Optional[Set[Tuple[str, str]]]): Checkpointed (CIK, accession number) pairs.
+            skip_accessions (Optional[Set[str]]): Accession numbers of filings found on disk.
+            old_df (Union[pd.DataFrame, list]): The existing filings metadata, if any.
+
+    Returns:
+            pd.DataFrame: The filings that still need to be downloaded.
+    """
+    skip_set = skip_set if skip_set is not None else set()
+    skip_accessions = skip_accessions if skip_accessions is not None else set()
+
+    recorded = {accession for _, accession in skip_set}
+    if len(old_df) > 0:
+        recorded.update(old_df["complete_text_file_link"].map(accession_from_link))
+    confirmed = skip_accessions & recorded
+
+    accessions = df["complete_text_file_link"].map(accession_from_link)
+    return df[
+        [
+            accession not in confirmed and (cik, accession) not in skip_set
+            for cik, accession in zip(df["CIK"], accessions)
+        ]
+    ]
+
+
+def scan_downloaded_accessions(raw_filings_folder: str) -> Set[str]:
+    """
+    Collects the accession numbers of all filings already saved under the raw filings folder.
+
+    Filenames follow <CIK>_<TYPE>_<YEAR>_<ACCESSION>.<EXT>, stored in <TYPE>/<YEAR> subfolders,
+    so this only lists directories and never opens a file. Temporary files of unfinished
+    downloads are ignored, and run_download only trusts the rest if a checkpoint or
+    metadata row confirms them.
+
+    Args:
+            raw_filings_folder (str): Raw filings folder path.
+
+    Returns:
+            Set[str]: The accession numbers found on disk.
+    """
+    accessions = set()
+    if not os.path.isdir(raw_filings_folder):
+        return accessions
+
+    dirs = [raw_filings_folder]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.name.count("_") >= 3 and not entry.name.endswith(".tmp"):
+                    accessions.add(os.path.splitext(entry.name)[0].rsplit("_", 1)[-1])
+
+    return accessions
+
+
+def load_completed_filings(
+    filepath: str = COMPLETED_FILINGS_FILE,
+) -> Set[Tuple[str, str]]:
+    """
+    Loads the (CIK, accession number) pairs recorded by run_download as already downloaded.
+
+    Malformed lines (e.g. a partial last line after the session was killed) are skipped.
+
+    Args:
+            filepath (str): Path to the completed filings log.
+
+    Returns:
+            Set[Tuple[str, str]]: The downloaded (CIK, accession number) pairs.
+    """
+    completed = set()
+    if not os.path.exists(filepath):
+        return completed
+
+    with open(filepath, "rb") as f:
+        for line in f:
+            try:
+                record = orjson.loads(line) if orjson else json.loads(line)
+                completed.add((str(record["cik"]), record["accession"]))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    return completed
+
+
 def download_indices(
     start_year: int,
     end_year: int,
@@ -230,6 +490,7 @@ def download_indices(
     skip_present_indices: bool,
     indices_folder: str,
     user_agent: str,
+    session: Optional[requests.Session] = None,
 ) -> None:
     """
     Downloads EDGAR Index files for the specified years and quarters.
@@ -241,11 +502,14 @@ def download_indices(
             skip_present_indices (bool): If True, the function will skip downloading indices that are already present in the directory.
             indices_folder (str): Directory where the indices will be saved.
             user_agent (str): The User-Agent string that will be declared to SEC EDGAR.
+            session (Optional[requests.Session]): Session to send requests with. Defaults to the shared session.
 
     Raises:
             ValueError: If an invalid quarter is passed.
     """
 
+    session = session or get_session()
+
     base_url = "https://www.sec.gov/Archives/edgar/full-index/"
 
     LOGGER.info("Downloading index files from SEC...")
@@ -281,11 +545,11 @@ def download_indices(
 
                 # Retry the download in case of failures
                 with tempfile.TemporaryFile(mode="w+b") as tmp:
-                    session = requests.Session()
                     try:
-                        request = requests_retry_session(
-                            retries=5, backoff_factor=0.2, session=session
-                        ).get(url=url, headers={"User-agent": user_agent})
+                        RATE_LIMITER.acquire()
+                        request = session.get(
+                            url=url, headers={"User-agent": user_agent}
+                        )
                     except requests.exceptions.RetryError as e:
                         LOGGER.info(f'Failed downloading "{index_filename}" - {e}')
                         failed_indices.append(index_filename)
@@ -333,6 +597,7 @@ def get_specific_indices(
     filing_types: List[str],
     user_agent: str,
     cik_tickers: Optional[List[str]] = None,
+    session: Optional[requests.Session] = None,
 ) -> pd.DataFrame:
     """
     Loops through all the indexes and keeps only the rows/Series for the specific filing types.
@@ -342,6 +607,7 @@ def get_specific_indices(
             filing_types (List[str]): The filing types to download, e.g., ['10-K', '8-K'].
             user_agent (str): The User-Agent string that will be declared to SEC EDGAR.
             cik_tickers (Optional[List[str]]): List of CIKs or Tickers. If None, the function processes all CIKs in the provided indices.
+            session (Optional[requests.Session]): Session to send requests with. Defaults to the shared session.
 
     Returns:
             pd.DataFrame: A dataframe which contains series only for the specific indices.
@@ -369,14 +635,14 @@ def get_specific_indices(
     if isinstance(cik_tickers, List) and len(cik_tickers):
         # Define the company_tickers_url
         company_tickers_url = "https://www.sec.gov/files/company_tickers.json"
+        session = session or get_session()
 
-        # Initialize a session for requests
-        session = requests.Session()
         try:
             # Try to download the company_tickers data
-            request = requests_retry_session(
-                retries=5, backoff_factor=0.2, session=session
-            ).get(url=company_tickers_url, headers={"User-agent": user_agent})
+            RATE_LIMITER.acquire()
+            request = session.get(
+                url=company_tickers_url, headers={"User-agent": user_agent}
+            )
         except (
             RequestException,
             HTTPError,
@@ -401,7 +667,8 @@ def get_specific_indices(
         # Convert all tickers in the cik_tickers list to CIKs
         for c_t in cik_tickers:
             if isinstance(c_t, int) or c_t.isdigit():  # If it is a CIK
-                ciks.append(str(c_t))
+                # Drop any zero padding, since the indices list CIKs without it
+                ciks.append(str(int(c_t)))
             else:  # If it is a ticker
                 if c_t in ticker2cik:
                     # If the ticker exists in the mapping, convert it to CIK
@@ -462,7 +729,11 @@ def get_specific_indices(
 
 
 def crawl(
-    filing_types: List[str], series: pd.Series, raw_filings_folder: str, user_agent: str
+    filing_types: List[str],
+    series: pd.Series,
+    raw_filings_folder: str,
+    user_agent: str,
+    session: Optional[requests.Session] = None,
 ) -> pd.Series:
     """
     Crawls the EDGAR HTML indexes and extracts required details.
@@ -474,11 +745,13 @@ def crawl(
             series (pd.Series): A single series with info for specific filings.
             raw_filings_folder (str): Raw filings folder path.
             user_agent (str): The User-agent string that will be declared to SEC EDGAR.
+            session (Optional[requests.Session]): Session to send requests with. Defaults to the shared session.
 
     Returns:
             pd.Series: The series with the extracted data.
     """
 
+    session = session or get_session()
     html_index = series["html_index"]
 
     # Retries for making the request if not successful at first attempt
@@ -486,10 +759,8 @@ def crawl(
         # Exponential backoff retry logic
         retries_exceeded = True
         for _ in range(5):
-            session = requests.Session()
-            request = requests_retry_session(
-                retries=5, backoff_factor=0.2, session=session
-            ).get(url=html_index, headers={"User-agent": user_agent})
+            RATE_LIMITER.acquire()
+            request = session.get(url=html_index, headers={"User-agent": user_agent})
 
             if (
                 "will be managed until action is taken to declare your traffic."
@@ -568,9 +839,12 @@ def crawl(
     except (HTMLParseError, Exception):
         pass
 
-    # Loading previously stored companies info
-    with open(os.path.join(DATASET_DIR, "companies_info.json")) as f:
-        company_info_dict = json.load(fp=f)
+    # Loading previously stored companies info. The lock only guards the file, so other
+    # threads are not blocked while this one fetches a company page
+    companies_info_filepath = os.path.join(DATASET_DIR, "companies_info.json")
+    with COMPANIES_INFO_LOCK:
+        with open(companies_info_filepath) as f:
+            company_info_dict = json.load(fp=f)
 
     # Ensuring info of current company is in the companies info dictionary
     cik = series["CIK"]
@@ -581,10 +855,10 @@ def crawl(
         try:
             retries_exceeded = True
             for _ in range(5):
-                session = requests.Session()
-                request = requests_retry_session(
-                    retries=5, backoff_factor=0.2, session=session
-                ).get(url=company_url, headers={"User-agent": user_agent})
+                RATE_LIMITER.acquire()
+                request = session.get(
+                    url=company_url, headers={"User-agent": user_agent}
+                )
 
                 if (
                     "will be managed until action is taken to declare your traffic."
@@ -641,9 +915,17 @@ def crawl(
                 if "Fiscal Year End" in str(content):
                     company_info_dict[cik]["Fiscal Year End"] = str(content).split()[-1]
 
-        # Updating the json file with the latest data
-        with open(os.path.join(DATASET_DIR, "companies_info.json"), "w") as f:
-            json.dump(obj=company_info_dict, fp=f, indent=4)
+        # Updating the json file with the latest data, merged into whatever other threads wrote
+        # since it was read. Write to a temporary file first and rename it into place
+        with COMPANIES_INFO_LOCK:
+            with open(companies_info_filepath) as f:
+                latest_company_info_dict = json.load(fp=f)
+            latest_company_info_dict[cik] = company_info_dict[cik]
+
+            temp_filepath = f"{companies_info_filepath}.tmp"
+            with open(temp_filepath, "w") as f:
+                json.dump(obj=latest_company_info_dict, fp=f, indent=4)
+            os.replace(temp_filepath, companies_info_filepath)
 
     # Filling series data with information from company_info_dict if they are missing in the series
     if pd.isna(series["SIC"]):
@@ -716,9 +998,7 @@ def crawl(
             if link_to_download is not None:
                 # In the filename, we remove any special characters from the filing type
                 filing_type_name = re.sub(r"[\-/\\]", "", filing_type)
-                accession_num = os.path.splitext(
-                    os.path.basename(series["complete_text_file_link"])
-                )[0]
+                accession_num = accession_from_link(series["complete_text_file_link"])
                 year = period_of_report[:4]  # Extract year from period_of_report
                 filename = f"{str(series['CIK'])}_{filing_type_name}_{year}_{accession_num}.{file_extension}"
 
@@ -733,6 +1013,7 @@ def crawl(
                     filename=filename,
                     download_folder=year_folder,
                     user_agent=user_agent,
+                    session=session,
                 )
                 if success:
                     series["filename"] = filename
@@ -744,7 +1025,13 @@ def crawl(
     return series
 
 
-def download(url: str, filename: str, download_folder: str, user_agent: str) -> bool:
+def download(
+    url: str,
+    filename: str,
+    download_folder: str,
+    user_agent: str,
+    session: Optional[requests.Session] = None,
+) -> bool:
     """
     Downloads a file from the given URL and saves it to the specified directory.
 
@@ -756,11 +1043,14 @@ def download(url: str, filename: str, download_folder: str, user_agent: str) ->
             filename (str): The name to give to the downloaded file. This should include the file extension.
             download_folder (str): The directory to save the downloaded file in.
             user_agent (str): The User-Agent string to use when making the request.
+            session (Optional[requests.Session]): Session to send requests with. Defaults to the shared session.
 
     Returns:
             bool: True if the download was successful, False otherwise.
     """
 
+    session = session or get_session()
+
     # Create the full file path
     filepath = os.path.join(download_folder, filename)
 
@@ -770,13 +1060,9 @@ def download(url: str, filename: str, download_folder: str, user_agent: str) ->
 
         # Attempt to download the file up to 5 times
         for _ in range(5):
-            # Create a new requests session
-            session = requests.Session()
-
-            # Make a GET request to the URL with retries and backoff
-            request = requests_retry_session(
-                retries=5, backoff_factor=0.2, session=session
-            ).get(url=url, headers={"User-agent": user_agent})
+            # Make a GET request to the URL, retrying with backoff on the session
+            RATE_LIMITER.acquire()
+            request = session.get(url=url, headers={"User-agent": user_agent})
 
             # If the response does not contain a specific error message, break the loop
             if (
@@ -796,9 +1082,12 @@ def download(url: str, filename: str, download_folder: str, user_agent: str) ->
         LOGGER.debug(f"Request for {url} failed due to network-related error: {err}")
         return False
 
-    # If the download was successful, save the file
-    with open(filepath, "wb") as f:
+    # If the download was successful, save the file. Write to a temporary file first and
+    # rename it into place, so an interrupted write never leaves a partial filing behind
+    temp_filepath = f"{filepath}.tmp"
+    with open(temp_filepath, "wb") as f:
         f.write(request.content)
+    os.replace(temp_filepath, filepath)
 
     # Uncomment the following lines to check the MD5 hash of the downloaded file
     # if hashlib.md5(open(filepath, 'rb').read()).hexdigest() != headers._headers[1][1].strip('"'):
@@ -811,8 +1100,9 @@ def download(url: str, filename: str, download_folder: str, user_agent: str) ->
 def requests_retry_session(
     retries: int = 5,
     backoff_factor: float = 0.5,
-    status_forcelist: tuple = (400, 401, 403, 500, 502, 503, 504, 505),
+    status_forcelist: tuple = (400, 401, 403, 429, 500, 502, 503, 504, 505),
     session: requests.Session = None,
+    pool_maxsize: int = 10,
 ) -> requests.Session:
     """
     Creates a new requests session that automatically retries failed requests.
@@ -824,6 +1114,7 @@ def requests_retry_session(
                     A retry is initiated if the HTTP status code of the response is in this list.
                     Default is a tuple of common server error codes.
             session (requests.Session): An existing requests session to use. If not provided, a new session will be created.
+            pool_maxsize (int): The number of connections kept alive per host. Default is 10.
 
     Returns:
             requests.Session: A requests session configured with retry behavior.
@@ -844,7 +1135,7 @@ def requests_retry_session(
 
     # Create an HTTPAdapter with the Retry object
     # HTTPAdapter is a built-in requests Adapter that sends HTTP requests
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
 
     # Mount the HTTPAdapter to the session for both HTTP and HTTPS requests
     session.mount("http://", adapter)
@@ -854,5 +1145,30 @@ def requests_retry_session(
     return session
 
 
+def get_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Returns the module-level session shared by all SEC requests, creating it on first use.
+
+    Reusing one session keeps connections alive across filings and batches,
+    instead of paying a new TCP + TLS handshake for every request.
+
+    Args:
+            pool_maxsize (int): The number of connections kept alive per host, should be at least
+                    the number of threads sending requests. Only used when the session is created.
+
+    Returns:
+            requests.Session: The shared session, configured with retry behavior.
+    """
+
+    global SESSION
+    with SESSION_LOCK:
+        if SESSION is None:
+            SESSION = requests_retry_session(
+                retries=5, backoff_factor=0.2, pool_maxsize=max(pool_maxsize, 10)
+            )
+            SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return SESSION
+
+
 if __name__ == "__main__":
     main()
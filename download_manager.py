@@ -24,132 +24,454 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import os
-import sys
+import shutil
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
-from tqdm import tqdm
+
+# pyarrow backs the Parquet copy of the metadata and faster CSV parsing (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# pandas CSV parser: pyarrow's is multi-threaded
+CSV_ENGINE = "pyarrow" if pa is not None else "c"
+
+# Bump when the shape of cached scan results changes
+SCAN_CACHE_VERSION = 2
+
+# Rows per row group in the Parquet copy of the metadata
+METADATA_ROW_GROUP_SIZE = 50_000
 
 
 class DownloadManager:
     """Manages and tracks EDGAR downloads"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        use_scan_cache=True,
+        approx_counts=False,
+        fast_storage=False,
+        stat_threads=None,
+    ):
         self.raw_filings_dir = "datasets/RAW_FILINGS"
         self.extracted_filings_dir = "datasets/EXTRACTED_FILINGS"
         self.metadata_file = "datasets/FILINGS_METADATA.csv"
+        self.metadata_parquet_file = "datasets/FILINGS_METADATA.parquet"
         self.wrds_file = "wrds_data/wrds_identifiers.csv"
-        self.progress_file = "logs/download_progress.csv"
+        self.progress_file = "logs/download_progress.jsonl"
+        # Written by earlier versions of colab_batch_downloader.py, until it imports it
+        self.legacy_progress_file = "logs/download_progress.csv"
+        self.scan_cache_file = "logs/.inventory_cache.json"
+        self.use_scan_cache = use_scan_cache
+        self.approx_counts = approx_counts
+        self.fast_storage = fast_storage
+        self.stat_threads = stat_threads
+        self._scan_cache = None
+        self._scan_cache_lock = threading.Lock()
+        self._reused_scan = False
+        self._metadata_cache = {}
+        self._metadata_mtime = None
+
+    @staticmethod
+    def _iter_files(root, dir_mtimes=None, skip=()):
+        """
+        Yield a DirEntry for every file under root.
+
+        Walks iteratively with a stack of directories instead of recursing, and
+        closes each directory handle as soon as it has been listed. Symlinked
+        directories are not descended into, so links cannot cause cycles.
+
+        Args:
+            root: Directory to walk
+            dir_mtimes: Optional dict filled with each directory's st_mtime_ns
+            skip: Subdirectory paths not to descend into
+
+        Yields:
+            os.DirEntry: Each file found
+        """
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                if dir_mtimes is not None:
+                    # Taken before listing, so changes made meanwhile show up next time
+                    dir_mtimes[path] = os.stat(path).st_mtime_ns
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in skip:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                # Skip directories we can't list
+                pass
 
-    def _count_files_recursive(self, dir_path, extension=None):
+    def _scan_tree(self, dir_path, want_ext=None):
         """
-        Count files recursively in a directory.
+        Walk a directory tree once, counting files, unique filings and bytes.
         Handles year-based subdirectory structure.
 
+        Each filing is identified by its unique accession number.
+        Filename pattern: {CIK}_{filing_type}_{year}_{accession_num}.{ext}
+
         Args:
-            dir_path: Directory to count files in
-            extension: Optional file extension filter (e.g., '.json')
+            dir_path: Directory to scan
+            want_ext: Optional file extension to count separately (e.g., '.json')
 
         Returns:
-            int: Total number of files
+            tuple: (total_files, unique_filings, ext_count, total_bytes)
         """
-        count = 0
+        return self._cached_scan(
+            f"scan|{os.path.abspath(dir_path)}|{want_ext}|{self.approx_counts}",
+            lambda dir_mtimes: self._walk_tree(dir_path, want_ext, dir_mtimes),
+        )
+
+    def _walk_tree(self, dir_path, want_ext, dir_mtimes):
+        """
+        Do the walk behind _scan_tree.
+
+        With approx_counts, accessions are kept as 64-bit string hashes in a
+        flat array (8 bytes per file instead of a set of strings) and counted
+        with np.unique; a miscount needs a hash collision, which is
+        negligible even for millions of filings.
+        """
+        total_files = 0
+        ext_count = 0
+        total_bytes = 0
+        if self.approx_counts:
+            accession_hashes = array("q")
+            add_accession = lambda accession: accession_hashes.append(hash(accession))
+        else:
+            unique_accessions = set()
+            add_accession = unique_accessions.add
+
+        for entry in self._iter_files(dir_path, dir_mtimes):
+            total_files += 1
+            total_bytes += self._file_size(entry)
+            if want_ext is None or entry.name.endswith(want_ext):
+                ext_count += 1
+            # Extract accession number from filename
+            # Format: {CIK}_{type}_{year}_{accession}.{ext}
+            parts = entry.name.rsplit('.', 1)[0].split('_')
+            if len(parts) >= 4:
+                add_accession(parts[-1])  # Last part is accession number
+
+        if self.approx_counts:
+            unique_filings = len(np.unique(np.frombuffer(accession_hashes, dtype=np.int64)))
+        else:
+            unique_filings = len(unique_accessions)
+
+        return total_files, unique_filings, ext_count, total_bytes
+
+    @staticmethod
+    def _file_size(entry):
+        """Size of a DirEntry's file, without following symlinks (0 if it vanished)"""
         try:
-            for entry in os.scandir(dir_path):
-                if entry.is_file():
-                    if extension is None or entry.name.endswith(extension):
-                        count += 1
-                elif entry.is_dir():
-                    # Recursively count files in subdirectories
-                    count += self._count_files_recursive(entry.path, extension)
-        except OSError as e:
-            # If we can't list the directory, use metadata as fallback
-            pass
-        return count
+            # Served from the DirEntry on Windows; one lstat elsewhere
+            return entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            return 0
 
-    def _count_unique_filings(self, dir_path):
+    def _cached_scan(self, key, scan):
         """
-        Count unique filings (not all files) in a directory.
-        Each filing is identified by its unique accession number.
+        Return a directory scan's results, reusing the on-disk cache when possible.
 
-        Filename pattern: {CIK}_{filing_type}_{year}_{accession_num}.{ext}
+        A cached result is reused only if every directory of the scanned tree
+        still has the modification time recorded during the scan; adding or
+        removing a file anywhere changes its directory's mtime. Rewriting a file
+        in place does not, so reused byte totals may be stale (see --rescan).
 
         Args:
-            dir_path: Directory to count filings in
+            key: Cache key identifying the scan
+            scan: Function taking a dict to fill with directory mtimes and
+                returning the results
+
+        Returns:
+            tuple: The scan's results
+        """
+        if not self.use_scan_cache:
+            return scan({})
+
+        # Scans may run on several threads; only cache access is serialized
+        with self._scan_cache_lock:
+            if self._scan_cache is None:
+                self._scan_cache = self._load_scan_cache()
+            cached = self._scan_cache.get(key)
+
+        if cached is not None and self._dirs_unchanged(cached["dirs"]):
+            self._reused_scan = True
+            return tuple(cached["result"])
+
+        dir_mtimes = {}
+        result = scan(dir_mtimes)
+        with self._scan_cache_lock:
+            self._scan_cache[key] = {"dirs": dir_mtimes, "result": list(result)}
+            self._save_scan_cache()
+        return result
+
+    def _scan_filing_trees(self):
+        """
+        Scan the RAW and EXTRACTED directory of every filing type concurrently.
+
+        Directory listing is syscall-bound and releases the GIL, so the
+        independent subtrees are walked on a thread pool of stat_threads
+        workers (default: one per subtree).
 
         Returns:
-            int: Number of unique filings
+            dict: (base_dir, filing_type) -> _scan_tree result, for existing dirs
         """
-        unique_accessions = set()
+        jobs = []
+        for base_dir, want_ext in [
+            (self.raw_filings_dir, None),
+            (self.extracted_filings_dir, ".json"),
+        ]:
+            for filing_type in ["10-K", "10-Q", "8-K"]:
+                dir_path = os.path.join(base_dir, filing_type)
+                if os.path.exists(dir_path):
+                    jobs.append(((base_dir, filing_type), dir_path, want_ext))
+
+        if not jobs:
+            return {}
+
+        max_workers = min(self.stat_threads or len(jobs), len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                key: executor.submit(self._scan_tree, dir_path, want_ext)
+                for key, dir_path, want_ext in jobs
+            }
+            return {key: future.result() for key, future in futures.items()}
+
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes):
+        """Check that every directory still has the recorded mtime"""
+        for path, mtime_ns in dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _load_scan_cache(self):
+        """Load cached directory scans, or an empty cache if missing or unreadable"""
         try:
-            for entry in os.scandir(dir_path):
-                if entry.is_file():
-                    # Extract accession number from filename
-                    # Format: {CIK}_{type}_{year}_{accession}.{ext}
-                    parts = entry.name.rsplit('.', 1)[0].split('_')
-                    if len(parts) >= 4:
-                        accession = parts[-1]  # Last part is accession number
-                        unique_accessions.add(accession)
-                elif entry.is_dir():
-                    # Recursively process subdirectories (year folders)
-                    unique_accessions.update(self._get_accessions_recursive(entry.path))
+            with open(self.scan_cache_file, "r") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("version") != SCAN_CACHE_VERSION:
+            return {}
+        return cache.get("scans", {})
+
+    def _save_scan_cache(self):
+        """Replace the scan cache file; failing to write it is not fatal"""
+        tmp_file = self.scan_cache_file + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.scan_cache_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(
+                    {"version": SCAN_CACHE_VERSION, "scans": self._scan_cache}, f
+                )
+            os.replace(tmp_file, self.scan_cache_file)
         except OSError:
             pass
-        return len(unique_accessions)
 
-    def _get_accessions_recursive(self, dir_path):
-        """Helper to recursively get all unique accession numbers"""
-        accessions = set()
+    def _load_metadata(self, columns, cik=None):
+        """
+        Load only the needed columns of the metadata file.
+
+        Reads the Parquet copy of the metadata when pyarrow is available,
+        otherwise the CSV. Columns missing from the file are left out rather
+        than raising, and CIK is returned as str. Unfiltered frames are cached
+        per column set until the CSV changes, so the sections of a report
+        share one read; callers get a shallow copy they may add columns to.
+
+        Args:
+            columns: Metadata columns to read; "year" adds the filing year,
+                parsed from filing_date
+            cik: Optional CIK to restrict the rows to
+
+        Returns:
+            pd.DataFrame: Metadata restricted to the available columns
+        """
+        # A long-lived manager must not keep serving frames of an older CSV
+        metadata_mtime = os.stat(self.metadata_file).st_mtime_ns
+        if metadata_mtime != self._metadata_mtime:
+            self._metadata_cache.clear()
+            self._metadata_mtime = metadata_mtime
+
+        key = frozenset(columns)
+        if cik is None and key in self._metadata_cache:
+            return self._metadata_cache[key].copy(deep=False)
+
+        want_year = "year" in columns
+        columns = [c for c in columns if c != "year"]
+        if want_year and "filing_date" not in columns:
+            columns.append("filing_date")
+
+        parquet_file = self._metadata_parquet()
+        if parquet_file is not None:
+            available = pq.read_schema(parquet_file).names
+            usecols = [c for c in columns if c in available]
+            # CIK is stored as text, so the filter is pushed into the scan
+            filters = [("CIK", "==", str(cik))] if cik is not None else None
+            metadata_df = pd.read_parquet(
+                parquet_file, columns=usecols, filters=filters
+            )
+        elif cik is not None:
+            # No Parquet scan to push the filter into; mask the cached full read
+            metadata_df = self._load_metadata(columns)
+            metadata_df = metadata_df[metadata_df["CIK"] == str(cik)]
+        else:
+            metadata_df = self._read_metadata_csv(columns)
+
+        if want_year and "filing_date" in metadata_df.columns:
+            metadata_df["year"] = self._parse_filing_dates(
+                metadata_df["filing_date"]
+            ).dt.year
+
+        if cik is not None:
+            return metadata_df
+        self._metadata_cache[key] = metadata_df
+        return metadata_df.copy(deep=False)
+
+    @staticmethod
+    def _parse_filing_dates(filing_dates):
+        """Parse filing dates, taking the fixed-format fast path for ISO dates"""
         try:
-            for entry in os.scandir(dir_path):
-                if entry.is_file():
-                    parts = entry.name.rsplit('.', 1)[0].split('_')
-                    if len(parts) >= 4:
-                        accessions.add(parts[-1])
-                elif entry.is_dir():
-                    accessions.update(self._get_accessions_recursive(entry.path))
-        except OSError:
-            pass
-        return accessions
+            return pd.to_datetime(filing_dates, format="%Y-%m-%d")
+        except ValueError:
+            # Not all plain ISO dates; let pandas infer the format
+            return pd.to_datetime(filing_dates)
+
+    def _read_metadata_csv(self, columns=None):
+        """Parse the metadata CSV, all columns if none are given"""
+        header = pd.read_csv(self.metadata_file, nrows=0).columns
+        usecols = [c for c in columns if c in header] if columns else list(header)
+        # Keep dates as text; pyarrow would otherwise infer date objects
+        dtype = {c: str for c in usecols if c != "CIK"}
+        metadata_df = pd.read_csv(
+            self.metadata_file, usecols=usecols, dtype=dtype, engine=CSV_ENGINE
+        )
+        if "CIK" in metadata_df.columns:
+            metadata_df["CIK"] = metadata_df["CIK"].astype(str)
+        return metadata_df
+
+    def _metadata_parquet(self):
+        """
+        Return the Parquet copy of the metadata, rebuilding it if the CSV is newer.
+
+        Returns:
+            str: Path to the Parquet file, or None if pyarrow is missing or the
+                copy cannot be written
+        """
+        if pa is None:
+            return None
+
+        try:
+            csv_mtime = os.stat(self.metadata_file).st_mtime_ns
+            if (
+                os.path.exists(self.metadata_parquet_file)
+                and os.stat(self.metadata_parquet_file).st_mtime_ns >= csv_mtime
+            ):
+                return self.metadata_parquet_file
+
+            # Rows clustered by CIK in small row groups: the min/max statistics
+            # then let a single-CIK filter skip nearly every row group
+            metadata_df = self._read_metadata_csv()
+            if "CIK" in metadata_df.columns:
+                metadata_df = metadata_df.sort_values("CIK", kind="stable")
+
+            tmp_file = self.metadata_parquet_file + ".tmp"
+            metadata_df.to_parquet(
+                tmp_file,
+                compression="zstd",
+                index=False,
+                row_group_size=METADATA_ROW_GROUP_SIZE,
+            )
+            os.replace(tmp_file, self.metadata_parquet_file)
+            return self.metadata_parquet_file
+        except (OSError, pa.ArrowException):
+            return None
 
     def check_setup(self):
         """Check if necessary files and directories exist"""
         print("Checking setup...\n")
 
         checks = {
-            "RAW filings directory": os.path.exists(self.raw_filings_dir),
-            "EXTRACTED filings directory": os.path.exists(self.extracted_filings_dir),
-            "Metadata file": os.path.exists(self.metadata_file),
-            "WRDS identifiers": os.path.exists(self.wrds_file),
-            "Progress tracker": os.path.exists(self.progress_file),
+            "RAW filings directory": self._stat_error(self.raw_filings_dir),
+            "EXTRACTED filings directory": self._stat_error(self.extracted_filings_dir),
+            "Metadata file": self._stat_error(self.metadata_file),
+            "WRDS identifiers": self._stat_error(self.wrds_file),
+            "Progress tracker": self._stat_error(self.progress_file),
         }
 
         all_good = True
-        for name, exists in checks.items():
-            status = "✅" if exists else "❌"
-            print(f"{status} {name}")
-            if not exists:
+        for name, error in checks.items():
+            if error is None:
+                print(f"✅ {name}")
+            elif isinstance(error, FileNotFoundError):
+                print(f"❌ {name}")
+            else:
+                # Exists but unusable, e.g. permission denied on a parent dir
+                print(f"❌ {name} ({error.strerror})")
+            if error is not None:
                 all_good = False
 
         return all_good
 
-    def get_storage_usage(self):
-        """Calculate storage usage"""
+    @staticmethod
+    def _stat_error(path):
+        """Return the OSError raised by stat-ing path, or None if it exists"""
+        try:
+            os.stat(path)
+        except OSError as e:
+            return e
+        return None
+
+    def get_storage_usage(self, scans=None):
+        """
+        Calculate storage usage.
+
+        Args:
+            scans: Optional _scan_filing_trees results; their subtrees' byte
+                totals are reused instead of walking them again
+        """
 
         def get_dir_size(path):
             """Get total size of directory"""
-            total = 0
-            try:
-                for entry in os.scandir(path):
-                    if entry.is_file():
-                        total += entry.stat().st_size
-                    elif entry.is_dir():
-                        total += get_dir_size(entry.path)
-            except Exception as e:
-                pass
-            return total
+            if self.fast_storage and os.path.ismount(path):
+                # One statvfs call; counts everything on that filesystem
+                return shutil.disk_usage(path).used
+
+            scanned = {
+                os.path.join(path, filing_type): result[3]
+                for (base_dir, filing_type), result in (scans or {}).items()
+                if base_dir == path
+            }
+
+            def scan(dir_mtimes):
+                total = 0
+                for entry in self._iter_files(path, dir_mtimes, skip=scanned):
+                    total += self._file_size(entry)
+                return (total,)
+
+            key = f"size|{os.path.abspath(path)}|{','.join(sorted(scanned))}"
+            return self._cached_scan(key, scan)[0] + sum(scanned.values())
 
         storage = {}
 
@@ -167,22 +489,28 @@ class DownloadManager:
         print("EDGAR DOWNLOAD INVENTORY")
         print("=" * 70)
 
+        # Each filing tree is walked once, for storage, counts and the comparison
+        scans = self._scan_filing_trees()
+
         # Storage usage
         print("\n💾 Storage Usage:")
-        storage = self.get_storage_usage()
+        storage = self.get_storage_usage(scans)
         total_gb = 0
         for name, size_bytes in storage.items():
             size_gb = size_bytes / (1024**3)
             total_gb += size_gb
             print(f"   {name}: {size_gb:.2f} GB")
         print(f"   Total: {total_gb:.2f} GB")
+        if self._reused_scan:
+            print("   [From the cached scan; files rewritten in place may be counted")
+            print("    at their old size. Run with --rescan to refresh]")
 
         # Metadata summary
         if os.path.exists(self.metadata_file):
             print("\n📊 Downloaded Filings (from metadata):")
             print("   [Successfully downloaded and recorded in FILINGS_METADATA.csv]")
             try:
-                metadata_df = pd.read_csv(self.metadata_file)
+                metadata_df = self._load_metadata(["Type", "filing_date", "CIK", "year"])
                 print(f"   Total filings: {len(metadata_df):,}")
 
                 # By filing type
@@ -195,9 +523,6 @@ class DownloadManager:
 
                 # By year
                 if "filing_date" in metadata_df.columns:
-                    metadata_df["year"] = pd.to_datetime(
-                        metadata_df["filing_date"]
-                    ).dt.year
                     print(f"\n   By Year:")
                     year_counts = metadata_df["year"].value_counts().sort_index()
                     for year, count in year_counts.items():
@@ -211,15 +536,19 @@ class DownloadManager:
             except Exception as e:
                 print(f"   ⚠️  Could not read metadata: {e}")
 
+        raw_scans = {
+            filing_type: result
+            for (base_dir, filing_type), result in scans.items()
+            if base_dir == self.raw_filings_dir
+        }
+
         # RAW filings count
         print("\n📁 RAW Filings (on disk):")
         print("   [Shows files in RAW_FILINGS directory]")
         if os.path.exists(self.raw_filings_dir):
             for filing_type in ["10-K", "10-Q", "8-K"]:
-                dir_path = os.path.join(self.raw_filings_dir, filing_type)
-                if os.path.exists(dir_path):
-                    total_files = self._count_files_recursive(dir_path)
-                    unique_filings = self._count_unique_filings(dir_path)
+                if filing_type in raw_scans:
+                    total_files, unique_filings, _, _ = raw_scans[filing_type]
 
                     if unique_filings > 0:
                         files_per_filing = total_files / unique_filings
@@ -231,19 +560,27 @@ class DownloadManager:
         print("\n📄 EXTRACTED Filings:")
         if os.path.exists(self.extracted_filings_dir):
             for filing_type in ["10-K", "10-Q", "8-K"]:
-                dir_path = os.path.join(self.extracted_filings_dir, filing_type)
-                if os.path.exists(dir_path):
-                    count = self._count_files_recursive(dir_path, extension=".json")
+                key = (self.extracted_filings_dir, filing_type)
+                if key in scans:
+                    _, _, count, _ = scans[key]
                     print(f"   {filing_type}: {count:,} JSON files")
 
         # Batch progress
-        if os.path.exists(self.progress_file):
+        if os.path.exists(self.progress_file) or os.path.exists(
+            self.legacy_progress_file
+        ):
             print("\n📈 Batch Download Progress:")
             try:
-                progress_df = pd.read_csv(self.progress_file)
+                if os.path.exists(self.progress_file):
+                    progress_df = pd.read_json(self.progress_file, lines=True)
+                else:
+                    progress_df = pd.read_csv(self.legacy_progress_file)
+                # Append-only log: keep the latest transition per batch
+                progress_df = progress_df.drop_duplicates("batch_id", keep="last")
                 total = len(progress_df)
-                completed = len(progress_df[progress_df["status"] == "completed"])
-                failed = len(progress_df[progress_df["status"] == "failed"])
+                status_counts = progress_df["status"].value_counts()
+                completed = int(status_counts.get("completed", 0))
+                failed = int(status_counts.get("failed", 0))
                 pending = total - completed - failed
 
                 print(f"   Total batches: {total}")
@@ -260,12 +597,13 @@ class DownloadManager:
         if os.path.exists(self.metadata_file) and os.path.exists(self.raw_filings_dir):
             print("\n🔍 Metadata vs Disk Comparison:")
             try:
-                metadata_df = pd.read_csv(self.metadata_file)
+                metadata_df = self._load_metadata(["Type", "filing_date", "CIK", "year"])
+                # One pass over Type instead of a boolean mask per filing type
+                type_counts = metadata_df["Type"].value_counts().to_dict() if "Type" in metadata_df.columns else {}
                 for filing_type in ["10-K", "10-Q", "8-K"]:
-                    metadata_count = len(metadata_df[metadata_df["Type"] == filing_type]) if "Type" in metadata_df.columns else 0
-                    dir_path = os.path.join(self.raw_filings_dir, filing_type)
-                    if os.path.exists(dir_path):
-                        disk_count = self._count_unique_filings(dir_path)
+                    metadata_count = type_counts.get(filing_type, 0)
+                    if filing_type in raw_scans:
+                        disk_count = raw_scans[filing_type][1]
                         diff = disk_count - metadata_count
                         status = "✅" if diff == 0 else ("⚠️" if abs(diff) < 100 else "❌")
 
@@ -295,10 +633,9 @@ class DownloadManager:
             return
 
         try:
-            metadata_df = pd.read_csv(self.metadata_file)
-            metadata_df["CIK"] = metadata_df["CIK"].astype(str)
-
-            firm_filings = metadata_df[metadata_df["CIK"] == str(cik)]
+            firm_filings = self._load_metadata(
+                ["CIK", "Type", "filing_date", "Filename"], cik=cik
+            )
 
             if len(firm_filings) == 0:
                 print(f"⚠️  No filings found for CIK {cik}")
@@ -313,7 +650,7 @@ class DownloadManager:
 
             # Date range
             if "filing_date" in firm_filings.columns:
-                dates = pd.to_datetime(firm_filings["filing_date"])
+                dates = self._parse_filing_dates(firm_filings["filing_date"])
                 print(f"\nDate Range:")
                 print(f"   Earliest: {dates.min().strftime('%Y-%m-%d')}")
                 print(f"   Latest: {dates.max().strftime('%Y-%m-%d')}")
@@ -347,17 +684,18 @@ class DownloadManager:
 
         try:
             # Load WRDS firms
-            wrds_df = pd.read_csv(self.wrds_file)
+            wrds_df = pd.read_csv(self.wrds_file, engine=CSV_ENGINE)
             wrds_df["cik"] = wrds_df["cik"].astype(str)
 
             # Load metadata
-            metadata_df = pd.read_csv(self.metadata_file)
-            metadata_df["CIK"] = metadata_df["CIK"].astype(str)
+            metadata_df = self._load_metadata(["CIK", "Type", "filing_date", "year"])
 
-            # Find firms with no downloads
-            downloaded_ciks = set(metadata_df["CIK"].unique())
-            all_ciks = set(wrds_df["cik"].unique())
-            missing_ciks = all_ciks - downloaded_ciks
+            # Find firms with no downloads: an anti-join of WRDS rows against
+            # the downloaded CIKs, as one hashed isin
+            downloaded_ciks = pd.Index(metadata_df["CIK"].unique())
+            missing_mask = ~wrds_df["cik"].isin(downloaded_ciks)
+            all_ciks = wrds_df["cik"].unique()
+            missing_ciks = wrds_df.loc[missing_mask, "cik"].unique()
 
             print(f"\n📊 Summary:")
             print(f"   Total firms in WRDS list: {len(all_ciks):,}")
@@ -366,7 +704,7 @@ class DownloadManager:
 
             if len(missing_ciks) > 0:
                 print(f"\n⚠️  Firms with no downloads (showing first 20):")
-                missing_firms = wrds_df[wrds_df["cik"].isin(missing_ciks)].head(20)
+                missing_firms = wrds_df[missing_mask].head(20)
                 for _, row in missing_firms.iterrows():
                     ticker = row.get("ticker", "N/A")
                     company = row.get("company_name", "N/A")
@@ -374,7 +712,7 @@ class DownloadManager:
 
                 # Save full list
                 missing_file = "logs/missing_firms.csv"
-                wrds_df[wrds_df["cik"].isin(missing_ciks)].to_csv(
+                wrds_df[missing_mask].to_csv(
                     missing_file, index=False
                 )
                 print(f"\n💾 Full list saved to: {missing_file}")
@@ -394,31 +732,31 @@ class DownloadManager:
                     f"   Expected range: {start_year}-{end_year} for {', '.join(filing_types)}"
                 )
 
-                # Check each firm
-                metadata_df["year"] = pd.to_datetime(metadata_df["filing_date"]).dt.year
-                incomplete_firms = []
+                print(f"   ⏳ Analyzing {len(downloaded_ciks):,} firms...")
+                start_time = time.perf_counter()
 
-                for cik in tqdm(downloaded_ciks, desc="Checking firms"):
-                    firm_filings = metadata_df[metadata_df["CIK"] == cik]
+                # Years present per firm and filing type, in one pass over the metadata
+                type_filings = metadata_df[metadata_df["Type"].isin(filing_types)]
+                years_by_firm = type_filings.groupby(["CIK", "Type"])["year"].agg(set)
 
-                    for filing_type in filing_types:
-                        type_filings = firm_filings[firm_filings["Type"] == filing_type]
+                expected_years = set(range(start_year, end_year + 1))
+                incomplete_firms = []
 
-                        if len(type_filings) > 0:
-                            years_present = set(type_filings["year"].unique())
-                            expected_years = set(range(start_year, end_year + 1))
-                            missing_years = expected_years - years_present
+                for (cik, filing_type), years_present in years_by_firm.items():
+                    missing_years = expected_years - years_present
+
+                    if len(missing_years) > 0:
+                        incomplete_firms.append(
+                            {
+                                "cik": cik,
+                                "filing_type": filing_type,
+                                "missing_years": sorted(missing_years),
+                                "years_present": len(years_present),
+                                "years_expected": len(expected_years),
+                            }
+                        )
 
-                            if len(missing_years) > 0:
-                                incomplete_firms.append(
-                                    {
-                                        "cik": cik,
-                                        "filing_type": filing_type,
-                                        "missing_years": sorted(missing_years),
-                                        "years_present": len(years_present),
-                                        "years_expected": len(expected_years),
-                                    }
-                                )
+                print(f"   Done in {time.perf_counter() - start_time:.1f}s")
 
                 if len(incomplete_firms) > 0:
                     print(
@@ -446,11 +784,22 @@ class DownloadManager:
     def generate_report(self, output_file=None):
         """Generate comprehensive report"""
 
-        if output_file:
-            # Redirect stdout to file
-            original_stdout = sys.stdout
-            sys.stdout = open(output_file, "w")
+        if not output_file:
+            self._print_report()
+            return
 
+        # Collect the report in memory and write it once; stdout is restored
+        # even if a section raises
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            self._print_report()
+        # The report is full of emoji; don't depend on the locale's encoding
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.write(buffer.getvalue())
+        print(f"\n✅ Report saved to: {output_file}")
+
+    def _print_report(self):
+        """Print every report section to stdout"""
         print("EDGAR CRAWLER - COMPREHENSIVE REPORT")
         print(f"Generated: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("=" * 70)
@@ -465,11 +814,6 @@ class DownloadManager:
         print("\n## MISSING FILINGS ANALYSIS")
         self.find_missing_filings()
 
-        if output_file:
-            sys.stdout.close()
-            sys.stdout = original_stdout
-            print(f"\n✅ Report saved to: {output_file}")
-
 
 def main():
     """Main entry point"""
@@ -508,10 +852,41 @@ Examples:
 
     parser.add_argument("--output", type=str, help="Output file for report")
 
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Walk the filing directories even if the cached scan is up to date",
+    )
+
+    parser.add_argument(
+        "--approx",
+        action="store_true",
+        help="Count unique filings from accession hashes to save memory on very large trees",
+    )
+
+    parser.add_argument(
+        "--fast-storage",
+        action="store_true",
+        help="Report a filing directory that is its own mount point as the used space of "
+        "that whole filesystem instead of walking it",
+    )
+
+    parser.add_argument(
+        "--stat-threads",
+        type=int,
+        help="Filing directories to walk concurrently (default: all six); "
+        "use 1 on a single spinning disk",
+    )
+
     args = parser.parse_args()
 
     # Create manager
-    manager = DownloadManager()
+    manager = DownloadManager(
+        use_scan_cache=not args.rescan,
+        approx_counts=args.approx,
+        fast_storage=args.fast_storage,
+        stat_threads=args.stat_threads,
+    )
 
     # Execute requested action
     if args.inventory:
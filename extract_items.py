@@ -1495,8 +1495,13 @@ class ExtractItems:
             os.mkdir(os.path.join(self.extracted_files_folder, filing_metadata["Type"]))
         # Write the JSON content to the file if it's not None
         if json_content is not None:
-            with open(absolute_json_filename, "w", encoding="utf-8") as filepath:
+            # Write to a temp file and rename it into place, so re-extracting a
+            # filing replaces the file instead of rewriting it (organize_output
+            # in flexible_extractor.py may have hardlinked it elsewhere)
+            tmp_json_filename = f"{absolute_json_filename}.tmp"
+            with open(tmp_json_filename, "w", encoding="utf-8") as filepath:
                 json.dump(json_content, filepath, indent=4, ensure_ascii=False)
+            os.replace(tmp_json_filename, absolute_json_filename)
 
         return 1
 
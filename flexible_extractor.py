@@ -32,6 +32,50 @@ from pathlib import Path
 # Import the original extraction module
 import extract_items
 
+# Valid 10-K items
+VALID_10K_ITEMS = (
+    "1",
+    "1A",
+    "1B",
+    "1C",
+    "2",
+    "3",
+    "4",
+    "5",
+    "6",
+    "7",
+    "7A",
+    "8",
+    "9",
+    "9A",
+    "9B",
+    "10",
+    "11",
+    "12",
+    "13",
+    "14",
+    "15",
+)
+
+# Valid 10-Q items (Part I and Part II items)
+VALID_10Q_ITEMS = (
+    "part_1__1",
+    "part_1__2",
+    "part_1__3",
+    "part_1__4",
+    "part_2__1",
+    "part_2__1A",
+    "part_2__2",
+    "part_2__3",
+    "part_2__4",
+    "part_2__5",
+    "part_2__6",
+)
+
+# Membership checks; the tuples above keep the order used in messages
+VALID_10K_ITEM_SET = frozenset(VALID_10K_ITEMS)
+VALID_10Q_ITEM_SET = frozenset(VALID_10Q_ITEMS)
+
 
 class FlexibleExtractor:
     """
@@ -67,46 +111,6 @@ class FlexibleExtractor:
     def validate_items(self):
         """Validate that requested items are valid"""
 
-        # Valid 10-K items
-        valid_10k_items = [
-            "1",
-            "1A",
-            "1B",
-            "1C",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "7A",
-            "8",
-            "9",
-            "9A",
-            "9B",
-            "10",
-            "11",
-            "12",
-            "13",
-            "14",
-            "15",
-        ]
-
-        # Valid 10-Q items (Part I and Part II items)
-        valid_10q_items = [
-            "part_1__1",
-            "part_1__2",
-            "part_1__3",
-            "part_1__4",
-            "part_2__1",
-            "part_2__1A",
-            "part_2__2",
-            "part_2__3",
-            "part_2__4",
-            "part_2__5",
-            "part_2__6",
-        ]
-
         print(f"\n🔍 Validating items to extract: {self.items_to_extract}")
 
         for item in self.items_to_extract:
@@ -114,12 +118,15 @@ class FlexibleExtractor:
             item_normalized = str(item).upper().replace(" ", "")
 
             # Check if it's a valid 10-K item
-            if "10-K" in self.filing_types and item_normalized not in valid_10k_items:
+            if (
+                "10-K" in self.filing_types
+                and item_normalized not in VALID_10K_ITEM_SET
+            ):
                 # Check if it might be a 10-Q item
-                if item not in valid_10q_items:
+                if item not in VALID_10Q_ITEM_SET:
                     print(f"   ⚠️  Warning: '{item}' may not be a valid item number")
-                    print(f"   Valid 10-K items: {', '.join(valid_10k_items)}")
-                    print(f"   Valid 10-Q items: {', '.join(valid_10q_items)}")
+                    print(f"   Valid 10-K items: {', '.join(VALID_10K_ITEMS)}")
+                    print(f"   Valid 10-Q items: {', '.join(VALID_10Q_ITEMS)}")
 
         print(f"✅ Items validated")
 
@@ -172,7 +179,8 @@ class FlexibleExtractor:
         custom_dir = f"datasets/{self.output_dir}"
         os.makedirs(custom_dir, exist_ok=True)
 
-        # Copy files from each filing type folder to custom directory
+        # Hardlink files from each filing type folder into the custom directory,
+        # copying only where links are not possible (other filesystem, no support)
         total_copied = 0
         for filing_type in self.filing_types:
             source_dir = os.path.join(original_dir, filing_type)
@@ -189,9 +197,12 @@ class FlexibleExtractor:
                 source_path = os.path.join(source_dir, filename)
                 dest_path = os.path.join(custom_dir, filename)
 
-                # Copy file (skip if already exists)
+                # Link or copy file (skip if already exists)
                 if not os.path.exists(dest_path):
-                    shutil.copy2(source_path, dest_path)
+                    try:
+                        os.link(source_path, dest_path)
+                    except OSError:
+                        shutil.copy2(source_path, dest_path)
                     total_copied += 1
 
             print(f"   ✅ Copied {len(json_files)} {filing_type} files")
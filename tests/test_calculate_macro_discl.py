@@ -0,0 +1,169 @@
+import os
+import random
+import re
+import tempfile
+import unittest
+from unittest import mock
+
+from bs4 import BeautifulSoup
+
+import calculate_macro_discl as cmd
+
+# Text as it reaches the counters, straight out of clean_text_for_matching
+TEXTS = [
+    "",
+    "fed",
+    "The Federal Reserve raised the interest rate, and GDP fell; inflation fears grew.",
+    # Word boundaries: exact unigrams only count as whole words
+    "imports important exported exporter fed federal fedex macro-economic "
+    "macroeconomics macroeconomicsmacro gdp's GNP gdp",
+    # Substrings count inside words, repeatedly
+    "hyperinflation disinflationary currencycurrency deflationrecession cryptocurrency",
+    # Overlapping bigrams each count
+    "foreign exchange market risk; global market risk; international economy "
+    "real real estate, economic growth economic growth",
+    # Bigrams across punctuation and line breaks, but not across words
+    "economic,\ncondition economic  (environment) economic the downturn "
+    "macroeconomic conditions",
+    # Non-ASCII letters are word characters: no boundary next to them
+    "Économie: l'inflation en été; importé, import é, Federal Reserve — "
+    "‘economic growth’ naïve fedé éfed gdp€ 中央 central bank",
+]
+
+
+def baseline_clean(raw_html):
+    """The original cleaning: BeautifulSoup text with tables and blocks removed"""
+    soup = BeautifulSoup(raw_html, "html.parser")
+    for element in soup(["script", "style", "head", "title", "meta"]):
+        element.decompose()
+    for table in soup.find_all("table"):
+        table.decompose()
+    text = re.sub(r"\s+", " ", soup.get_text(separator=" ")).strip()
+    return baseline_normalize(text)
+
+
+def baseline_normalize(text):
+    """The original clean_text_for_matching"""
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def baseline_counts(text):
+    """The original counting: one regex search per dictionary term"""
+    breakdown = {
+        "exact_unigrams": sum(
+            len(re.findall(r"\b" + re.escape(term) + r"\b", text))
+            for term in cmd.EXACT_UNIGRAMS
+        ),
+        "substring_unigrams": sum(
+            len(re.findall(term, text)) for term in cmd.SUBSTRING_UNIGRAMS
+        ),
+        "bigrams": sum(
+            len(re.findall(re.escape(bigram), text)) for bigram in cmd.BIGRAMS
+        ),
+    }
+    return sum(breakdown.values()), breakdown
+
+
+def random_texts(n, seed=0):
+    """Texts mixing dictionary words, their fragments and non-ASCII neighbours"""
+    vocabulary = sorted(
+        {
+            word
+            for term in cmd.EXACT_UNIGRAMS + cmd.SUBSTRING_UNIGRAMS + cmd.BIGRAMS
+            for word in term.split()
+        }
+    )
+    fragments = ["hyper", "s", "al", "ed", "é", "ü", "1", "_", "the", "of", "-", ", "]
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        pieces = []
+        for _ in range(rng.randint(1, 60)):
+            piece = rng.choice(vocabulary)
+            if rng.random() < 0.3:
+                piece = rng.choice(fragments) + piece
+            if rng.random() < 0.3:
+                piece += rng.choice(fragments)
+            pieces.append(piece)
+            pieces.append(rng.choice([" ", " ", " ", "", ". "]))
+        texts.append("".join(pieces))
+    return texts
+
+
+class TestCountMacroTerms(unittest.TestCase):
+    def check_backend(self):
+        for raw in TEXTS + random_texts(200):
+            text = cmd.clean_text_for_matching(raw)
+            with self.subTest(text=text[:80]):
+                self.assertEqual(cmd.count_macro_terms(text), baseline_counts(text))
+                self.assertEqual(cmd.count_words(text), len(text.split()))
+
+    @unittest.skipIf(cmd.njit is None, "numba is not installed")
+    def test_numba_scanner(self):
+        self.check_backend()
+
+    @unittest.skipIf(cmd.ahocorasick is None, "pyahocorasick is not installed")
+    def test_aho_corasick(self):
+        with mock.patch.object(cmd, "_BYTE_TABLES", None):
+            self.check_backend()
+
+    @unittest.skipIf(cmd.re2 is None, "google-re2 is not installed")
+    def test_re2_bigrams(self):
+        with mock.patch.object(cmd, "_BYTE_TABLES", None), mock.patch.object(
+            cmd, "_AUTOMATON", None
+        ):
+            self.check_backend()
+
+    def test_token_fallback(self):
+        with mock.patch.object(cmd, "_BYTE_TABLES", None), mock.patch.object(
+            cmd, "_AUTOMATON", None
+        ), mock.patch.object(cmd, "re2", None):
+            self.check_backend()
+
+
+RAW_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><head><title>Form 10-K</title><meta name="x" content="inflation">
+<style>p { color: red } /* inflation */</style></head>
+<body>
+<!-- Federal Reserve commentary hidden in a comment -->
+<script type="text/javascript">var gdp = "economic growth";</script>
+<p>Changes in the <b>Federal</b> Reserve&#8217;s monetary&nbsp;policy and
+<i>interest rate</i> levels &amp; inflation could affect us.</p>
+<table><tr><td>Inflation</td><td>2.1%</td></tr>
+<tr><td><table><tr><td>GDP nested</td></tr></table></td></tr></table>
+<div>Foreign exchange market risk &mdash; see Item&nbsp;7A.<br/>Économie, importé.</div>
+<TABLE border=1><TR><TD>Credit risk</TD></TR></TABLE>
+<p>Plain closing text about the global economy.</p>
+</body></html>
+"""
+
+
+class TestCleaning(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def prepare(self, raw, use_html_parser):
+        """Run the file cleaning pipeline on raw filing text"""
+        file_path = os.path.join(self.tmp_dir.name, "filing.htm")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(raw)
+        with mock.patch.object(cmd, "USE_HTML_PARSER", use_html_parser):
+            return cmd._prepare_text(file_path)
+
+    def test_regex_and_parser_paths_match_baseline(self):
+        plain_text = "Plain text filing: Federal Reserve, inflation &amp; GDP.\n"
+        for raw in (RAW_HTML, plain_text):
+            expected = baseline_clean(raw)
+            for use_html_parser in (False, True):
+                with self.subTest(raw=raw[:20], use_html_parser=use_html_parser):
+                    text = self.prepare(raw, use_html_parser)
+                    self.assertEqual(text, expected)
+                    self.assertEqual(
+                        cmd.count_macro_terms(text), baseline_counts(expected)
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
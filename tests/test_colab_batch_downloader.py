@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+import colab_batch_downloader
+from colab_batch_downloader import ColabBatchDownloader
+
+
+def progress_line(batch_id, status, firms_count=500):
+    """One status transition, as save_progress appends it"""
+    return (
+        json.dumps(
+            {
+                "batch_id": batch_id,
+                "status": status,
+                "timestamp": "2024-01-01T00:00:00",
+                "firms_count": firms_count,
+            }
+        )
+        + "\n"
+    )
+
+
+class TestProgressLog(unittest.TestCase):
+    def setUp(self):
+        # The progress log lives under logs/ in the current directory
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+        os.makedirs("logs")
+
+        self.downloader = ColabBatchDownloader("wrds_identifiers.csv", batch_size=500)
+        self.downloader.firms_df = pd.DataFrame({"cik": range(1200)})
+        self.downloader.batches = [
+            {
+                "batch_id": batch_id,
+                "start_idx": start_idx,
+                "end_idx": min(start_idx + 500, 1200),
+                "firms_count": min(500, 1200 - start_idx),
+                "status": "pending",
+            }
+            for batch_id, start_idx in enumerate(range(0, 1200, 500), start=1)
+        ]
+
+    def write_progress(self, data):
+        with open(self.downloader.progress_file, "w") as f:
+            f.write(data)
+
+    def test_partial_last_line_truncated(self):
+        complete = progress_line(1, "in_progress") + progress_line(1, "completed")
+        # A session killed mid-write leaves a partial last line
+        self.write_progress(complete + '{"batch_id": 2, "sta')
+
+        progress = self.downloader._read_progress()
+
+        self.assertEqual(progress[1]["status"], "completed")
+        self.assertNotIn(2, progress)
+        with open(self.downloader.progress_file) as f:
+            self.assertEqual(f.read(), complete)
+
+        # The next transition starts on a fresh line
+        self.downloader.save_progress(2, "in_progress")
+        self.assertEqual(self.downloader._read_progress()[2]["status"], "in_progress")
+
+    def test_corrupt_log(self):
+        lines = [progress_line(1, "completed")] * 9 + ["not json\n"]
+        self.write_progress("".join(lines))
+        # One bad line in ten is within the limit and skipped
+        self.assertEqual(self.downloader._read_progress()[1]["status"], "completed")
+
+        self.write_progress("".join(lines + ['{"status": "completed"}\n']))
+        with self.assertRaises(ValueError):
+            self.downloader._read_progress()
+
+        # load_progress keeps the batches as they were rather than trusting the log
+        self.downloader.load_progress()
+        self.assertEqual(
+            [batch["status"] for batch in self.downloader.batches], ["pending"] * 3
+        )
+
+    def test_import_legacy_progress(self):
+        pd.DataFrame(
+            {
+                "batch_id": [1, 2, 1],
+                "status": ["in_progress", "in_progress", "completed"],
+                "timestamp": ["2024-01-01T00:00:00"] * 3,
+                "firms_count": [500, None, None],
+            }
+        ).to_csv(self.downloader.legacy_progress_file, index=False)
+
+        self.downloader.load_progress()
+
+        with open(self.downloader.progress_file) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(
+            [(r["batch_id"], r["status"], r["firms_count"]) for r in records],
+            [(1, "in_progress", 500), (2, "in_progress", None), (1, "completed", None)],
+        )
+        self.assertEqual(
+            [batch["status"] for batch in self.downloader.batches],
+            ["completed", "in_progress", "pending"],
+        )
+
+        # A completed batch without a firms_count is left out of the firm total
+        self.downloader.save_progress(3, "completed")
+        with self.assertLogs(colab_batch_downloader.logger, "INFO") as logs:
+            self.downloader.generate_summary()
+        self.assertIn("INFO:edgar.batch:   Processed: 200 (16.7%)", logs.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import pandas as pd
+
+import consolidate_output
+from consolidate_output import LEGACY_INDEX_FILE, OutputConsolidator
+
+FIXTURES_DIR = os.path.abspath(os.path.join("tests", "fixtures"))
+
+
+class TestStreamConsolidation(unittest.TestCase):
+    def setUp(self):
+        # The consolidator works on datasets/ and logs/ under the current directory
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        with zipfile.ZipFile(
+            os.path.join(FIXTURES_DIR, "EXTRACTED_FILINGS", "10-K.zip")
+        ) as zf:
+            zf.extractall(os.path.join("datasets", "EXTRACTED_FILINGS"))
+        self.extracted_dir = os.path.join("datasets", "EXTRACTED_FILINGS", "10-K")
+
+    def consolidate(self, output_file, stream, use_index=True, **kwargs):
+        """Run the consolidator quietly and load its output back"""
+        consolidator = OutputConsolidator(
+            output_file=output_file,
+            stream=stream,
+            max_workers=2,
+            use_index=use_index,
+        )
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(consolidator.run(**kwargs))
+
+        if output_file.endswith(".parquet"):
+            df = pd.read_parquet(output_file)
+        else:
+            df = pd.read_csv(output_file)
+        return df.sort_values("filename").reset_index(drop=True)
+
+    def assert_same_output(self, expected, actual):
+        """Compare two outputs, treating all kinds of missing values alike"""
+        self.assertEqual(list(expected.columns), list(actual.columns))
+
+        def normalize(df):
+            return df.astype(object).where(df.notna(), None)
+
+        pd.testing.assert_frame_equal(
+            normalize(expected), normalize(actual), check_dtype=False
+        )
+
+    def add_item_to_last_file(self, key, text):
+        """Add an item to the file listed last, so it first shows up in a later batch"""
+        with os.scandir(self.extracted_dir) as entries:
+            last_file = [entry.path for entry in entries][-1]
+        with open(last_file) as f:
+            data = json.load(f)
+        data[key] = text
+        with open(last_file, "w") as f:
+            json.dump(data, f, indent=4)
+
+    @mock.patch.object(consolidate_output, "STREAM_BATCH_SIZE", 10)
+    @mock.patch.object(consolidate_output, "FILE_BATCH_SIZE", 4)
+    def test_stream_matches_in_memory_all_items(self):
+        self.add_item_to_last_file("item_99", "Only in one filing")
+
+        expected = self.consolidate("all.csv", stream=False, load_all=True)
+        self.assertEqual(expected["item_99"].notna().sum(), 1)
+
+        actual = self.consolidate("all_stream.csv", stream=True, load_all=True)
+        self.assert_same_output(expected, actual)
+
+    @mock.patch.object(consolidate_output, "STREAM_BATCH_SIZE", 10)
+    @mock.patch.object(consolidate_output, "FILE_BATCH_SIZE", 4)
+    def test_stream_matches_in_memory_items(self):
+        expected = self.consolidate("items.csv", stream=False, items=["1", "7"])
+        actual = self.consolidate("items_stream.csv", stream=True, items=["1", "7"])
+        self.assert_same_output(expected, actual)
+
+    @unittest.skipIf(consolidate_output.pa is None, "pyarrow is not installed")
+    @mock.patch.object(consolidate_output, "STREAM_BATCH_SIZE", 10)
+    def test_stream_matches_in_memory_parquet(self):
+        self.add_item_to_last_file("item_99", "Only in one filing")
+
+        expected = self.consolidate("all.parquet", stream=False, load_all=True)
+        actual = self.consolidate("all_stream.parquet", stream=True, load_all=True)
+        self.assert_same_output(expected, actual)
+
+    def test_indexed_reads_match_full_decode(self):
+        expected = self.consolidate(
+            "items.csv", stream=False, items=["1", "7"], use_index=False
+        )
+        self.assertFalse(os.path.exists(OutputConsolidator()._index_path()))
+
+        # The first indexed run builds the index, the second reads only items 1 and 7
+        for _ in range(2):
+            actual = self.consolidate(
+                "items_indexed.csv", stream=False, items=["1", "7"]
+            )
+            self.assert_same_output(expected, actual)
+        self.assertTrue(os.path.exists(OutputConsolidator()._index_path()))
+
+    def test_index_kept_out_of_extracted_dir(self):
+        # An index left in the extracted directory by earlier versions
+        with open(os.path.join(self.extracted_dir, LEGACY_INDEX_FILE), "w") as f:
+            f.write("{}")
+
+        self.consolidate("items.csv", stream=False, items=["7"])
+
+        self.assertTrue(os.path.exists(OutputConsolidator()._index_path()))
+        # Only the filings are left, so other tools can list the directory
+        self.assertNotIn(LEGACY_INDEX_FILE, os.listdir(self.extracted_dir))
+        self.assertEqual(len(os.listdir(self.extracted_dir)), 62)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+import builtins
+import io
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+import pandas as pd
+
+import download_filings
+
+CIK = "320193"
+ACCESSION = "0000320193-20-000096"
+HTML_INDEX = f"https://www.sec.gov/Archives/edgar/data/{CIK}/{ACCESSION}-index.html"
+DOCUMENT_PATH = f"/Archives/edgar/data/{CIK}/000032019320000096/aapl-20200926.htm"
+
+FILING_INDEX_PAGE = f"""<html><body>
+<div class="formGrouping">
+<div class="infoHead">Filing Date</div>
+<div class="info">2020-10-30</div>
+<div class="infoHead">Period of Report</div>
+<div class="info">2020-09-26</div>
+</div>
+<div class="companyInfo"><p class="identInfo">State of Incorp.: CA | Fiscal Year End: 0926</p></div>
+<table class="tableFile" summary="Document Format Files">
+<tr><th>Seq</th><th>Description</th><th>Document</th><th>Type</th><th>Size</th></tr>
+<tr>
+<td>1</td>
+<td>10-K</td>
+<td><a href="{DOCUMENT_PATH}">aapl-20200926.htm</a></td>
+<td>10-K</td>
+<td>1</td>
+</tr>
+</table>
+</body></html>"""
+
+
+def master_index_zip():
+    """EDGAR full index for one quarter, holding a single 10-K"""
+    lines = [f"header line {i}\n" for i in range(11)]
+    lines.append(f"{CIK}|Apple Inc.|10-K|2020-10-30|edgar/data/{CIK}/{ACCESSION}.txt\n")
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("master.idx", "".join(lines))
+    return buffer.getvalue()
+
+
+def filing_link(cik, accession):
+    """Complete submission text file link of a filing, as found in the EDGAR indices"""
+    return f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}.txt"
+
+
+class StubSession:
+    """Stands in for requests.Session, answering known SEC URLs and recording the rest"""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        for prefix, content in self.responses.items():
+            if url.startswith(prefix):
+                break
+        else:
+            content = b"<html></html>"
+        return mock.Mock(content=content, text=content.decode("latin-1"))
+
+
+class TestRunDownload(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        # No config.json in the working directory: everything comes from the params
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self.dataset_dir = os.path.join(self.tmp_dir.name, "datasets")
+        os.makedirs(self.dataset_dir)
+        for target, value in [
+            ("DATASET_DIR", self.dataset_dir),
+            (
+                "COMPLETED_FILINGS_FILE",
+                os.path.join(self.tmp_dir.name, "completed_filings.jsonl"),
+            ),
+        ]:
+            patcher = mock.patch.object(download_filings, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_run_download_in_memory(self):
+        params = {
+            "start_year": 2020,
+            "end_year": 2020,
+            "quarters": [4],
+            "filing_types": ["10-K"],
+            "cik_tickers": [CIK],
+            "user_agent": "Test test@example.com",
+            "raw_filings_folder": "RAW_FILINGS",
+            "indices_folder": "INDICES",
+            "filings_metadata_file": "FILINGS_METADATA.csv",
+            "skip_present_indices": True,
+            "max_workers": 1,
+        }
+        session = StubSession(
+            {
+                "https://www.sec.gov/Archives/edgar/full-index/": master_index_zip(),
+                "https://www.sec.gov/files/company_tickers.json": b"{}",
+                HTML_INDEX: FILING_INDEX_PAGE.encode(),
+                "https://www.sec.gov" + DOCUMENT_PATH: b"<html>10-K</html>",
+            }
+        )
+
+        opened = []
+        real_open = builtins.open
+
+        def spy_open(file, *args, **kwargs):
+            opened.append(os.path.abspath(file) if isinstance(file, str) else file)
+            return real_open(file, *args, **kwargs)
+
+        skip_set = set()
+        with mock.patch("builtins.open", spy_open):
+            download_filings.run_download(params, session=session, skip_set=skip_set)
+
+        # Every request went through the given session
+        self.assertIn(HTML_INDEX, session.urls)
+        self.assertIn("https://www.sec.gov" + DOCUMENT_PATH, session.urls)
+
+        # config.json was neither read nor written
+        config_path = os.path.join(self.tmp_dir.name, "config.json")
+        self.assertNotIn(config_path, opened)
+        self.assertFalse(os.path.exists(config_path))
+
+        filename = f"{CIK}_10K_2020_{ACCESSION}.htm"
+        with real_open(
+            os.path.join(self.dataset_dir, "RAW_FILINGS", "10-K", "2020", filename),
+            "rb",
+        ) as f:
+            self.assertEqual(f.read(), b"<html>10-K</html>")
+        metadata_df = pd.read_csv(
+            os.path.join(self.dataset_dir, "FILINGS_METADATA.csv"), dtype=str
+        )
+        self.assertEqual(list(metadata_df["filename"]), [filename])
+        self.assertEqual(skip_set, {(CIK, ACCESSION)})
+
+
+class TestResumeSkipSet(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_load_completed_filings(self):
+        filepath = os.path.join(self.tmp_dir.name, "completed_filings.jsonl")
+        with open(filepath, "w") as f:
+            f.write(
+                json.dumps(
+                    {
+                        "cik": "320193",
+                        "accession": "0000320193-23-000106",
+                        "type": "10-K",
+                    }
+                )
+                + "\n"
+            )
+            f.write(
+                json.dumps(
+                    {"cik": 789019, "accession": "0000950170-23-035122", "type": "10-K"}
+                )
+                + "\n"
+            )
+            # A session killed mid-write leaves a partial last line
+            f.write('{"cik": "1018724", "accessi')
+
+        self.assertEqual(
+            download_filings.load_completed_filings(filepath),
+            {
+                ("320193", "0000320193-23-000106"),
+                ("789019", "0000950170-23-035122"),
+            },
+        )
+        self.assertEqual(
+            download_filings.load_completed_filings(
+                os.path.join(self.tmp_dir.name, "missing.jsonl")
+            ),
+            set(),
+        )
+
+    def test_scan_downloaded_accessions(self):
+        year_folder = os.path.join(self.tmp_dir.name, "10-K", "2023")
+        os.makedirs(year_folder)
+        for filename in [
+            "320193_10K_2023_0000320193-23-000106.htm",
+            "789019_10K_2023_0000950170-23-035122.htm",
+            # An unfinished download, never renamed into place
+            "1018724_10K_2023_0001018724-23-000004.htm.tmp",
+            "notes.txt",
+        ]:
+            open(os.path.join(year_folder, filename), "w").close()
+
+        self.assertEqual(
+            download_filings.scan_downloaded_accessions(self.tmp_dir.name),
+            {"0000320193-23-000106", "0000950170-23-035122"},
+        )
+        self.assertEqual(
+            download_filings.scan_downloaded_accessions(
+                os.path.join(self.tmp_dir.name, "missing")
+            ),
+            set(),
+        )
+
+    def test_drop_downloaded_filings(self):
+        filings = [
+            ("320193", "0000320193-23-000106"),  # checkpointed
+            ("789019", "0000950170-23-035122"),  # on disk and in the metadata
+            ("1018724", "0001018724-23-000004"),  # on disk only, maybe incomplete
+            ("1652044", "0001652044-23-000016"),  # not downloaded
+        ]
+        df = pd.DataFrame(
+            {
+                "CIK": [cik for cik, _ in filings],
+                "complete_text_file_link": [
+                    filing_link(cik, accession) for cik, accession in filings
+                ],
+            }
+        )
+        old_df = df.iloc[[1]]
+        skip_set = {filings[0]}
+        skip_accessions = {filings[1][1], filings[2][1]}
+
+        pending = download_filings.drop_downloaded_filings(
+            df, skip_set, skip_accessions, old_df
+        )
+        self.assertEqual(list(pending["CIK"]), ["1018724", "1652044"])
+
+        # Without metadata, files on disk are only trusted if checkpointed
+        pending = download_filings.drop_downloaded_filings(
+            df, skip_set, skip_accessions
+        )
+        self.assertEqual(list(pending["CIK"]), ["789019", "1018724", "1652044"])
+
+        # Nothing to skip
+        pending = download_filings.drop_downloaded_filings(df)
+        self.assertEqual(len(pending), len(df))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from download_manager import DownloadManager
+
+FIXTURES_DIR = os.path.abspath(os.path.join("tests", "fixtures"))
+
+# (total files, unique filings, files with the counted extension, bytes) per fixture tree.
+# One 10-K filing was extracted twice under different filenames.
+RAW_8K = (553, 553, 553, 22539504)
+EXTRACTED_8K = (553, 553, 553, 2601832)
+EXTRACTED_10K = (62, 61, 62, 13643984)
+
+
+class TestInventory(unittest.TestCase):
+    def setUp(self):
+        # The manager works on datasets/ and logs/ under the current directory
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)
+        self.addCleanup(os.chdir, cwd)
+
+        for folder_name, filing_type in [
+            ("RAW_FILINGS", "8-K"),
+            ("EXTRACTED_FILINGS", "8-K"),
+            ("EXTRACTED_FILINGS", "10-K"),
+        ]:
+            with zipfile.ZipFile(
+                os.path.join(FIXTURES_DIR, folder_name, f"{filing_type}.zip")
+            ) as zf:
+                zf.extractall(os.path.join("datasets", folder_name))
+
+    def test_scan_filing_trees(self):
+        # Counting accession hashes must give the same counts as the exact sets
+        for approx_counts in (False, True):
+            manager = DownloadManager(use_scan_cache=False, approx_counts=approx_counts)
+            self.assertEqual(
+                manager._scan_filing_trees(),
+                {
+                    ("datasets/RAW_FILINGS", "8-K"): RAW_8K,
+                    ("datasets/EXTRACTED_FILINGS", "8-K"): EXTRACTED_8K,
+                    ("datasets/EXTRACTED_FILINGS", "10-K"): EXTRACTED_10K,
+                },
+            )
+
+    def test_show_inventory(self):
+        manager = DownloadManager(use_scan_cache=False)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            manager.show_inventory()
+        output = output.getvalue()
+
+        self.assertIn(
+            "8-K: 553 unique filings (553 total files, ~1.0 files/filing)", output
+        )
+        self.assertIn("10-K: 62 JSON files", output)
+        self.assertIn("8-K: 553 JSON files", output)
+
+    def test_scan_cache(self):
+        scans = DownloadManager()._scan_filing_trees()
+        self.assertTrue(os.path.exists(os.path.join("logs", ".inventory_cache.json")))
+
+        # A second manager reuses the cached scans while no directory changed
+        with mock.patch.object(
+            DownloadManager, "_walk_tree", side_effect=AssertionError("walked")
+        ):
+            self.assertEqual(DownloadManager()._scan_filing_trees(), scans)
+
+        # Adding a file changes its directory's mtime, so that tree is walked again
+        open(
+            os.path.join(
+                "datasets", "RAW_FILINGS", "8-K", "1_8K_2024_0000000001-24-000001.htm"
+            ),
+            "w",
+        ).close()
+        self.assertEqual(
+            DownloadManager()._scan_filing_trees()[("datasets/RAW_FILINGS", "8-K")],
+            (554, 554, 554, RAW_8K[3]),
+        )
+
+    def test_storage_usage(self):
+        manager = DownloadManager(use_scan_cache=False)
+        self.assertEqual(
+            manager.get_storage_usage(manager._scan_filing_trees()),
+            {
+                "RAW filings": RAW_8K[3],
+                "EXTRACTED filings": EXTRACTED_8K[3] + EXTRACTED_10K[3],
+            },
+        )
+
+        # Sizes reused from the scan cache are flagged, since in-place rewrites go unseen
+        for expect_note in (False, True):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                DownloadManager().show_inventory()
+            self.assertEqual("From the cached scan" in output.getvalue(), expect_note)
+
+
+if __name__ == "__main__":
+    unittest.main()